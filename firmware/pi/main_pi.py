@@ -1,14 +1,17 @@
 # Vintage Radio Firmware - Raspberry Pi 2W/3
 # Uses the same RadioCore as the Pico/DFPlayer build; hardware via pi_hardware (VLC + GPIO).
 
+import os
+import threading
 import time
+from collections import deque
 
 from radio_core import (
     RadioCore,
     MODE_ALBUM,
     MODE_PLAYLIST,
-    MODE_SHUFFLE,
     MODE_RADIO,
+    MODE_ID_SHUFFLE,
     LONG_PRESS_MS,
     TAP_WINDOW_MS,
     POST_CMD_GUARD_MS,
@@ -17,6 +20,34 @@ from radio_core import (
 )
 from components.pi_hardware import PiHardware
 
+# Chatty per-event output only when VINTAGE_RADIO_DEBUG is set (bring-up); boot and
+# power transitions always use print().
+DEBUG = bool(os.environ.get("VINTAGE_RADIO_DEBUG"))
+
+
+def _no_log(*_args, **_kwargs):
+    pass
+
+
+log = print if DEBUG else _no_log
+
+# With edge events, still re-read the power-sense pin this often (see handle_power_events).
+POWER_RECHECK_MS = 250
+# VLC state is unreliable this long after a start; is_playing() is not asked until then
+TRACK_SETTLE_MS = 2000
+
+_REQUIRED_HW_METHODS = (
+    "play_track",
+    "start_with_am",
+    "has_track",
+    "is_playing",
+    "is_power_on",
+    "is_button_pressed",
+    "reset_dfplayer",
+    "set_volume",
+    "set_power_edge_callback",
+)
+
 # ===========================
 #      MAIN FIRMWARE CLASS
 # ===========================
@@ -27,26 +58,46 @@ class VintageRadioFirmwarePi:
 
     def __init__(self, media_root=None):
         print("Booting Vintage Radio (Pi, RadioCore-based)")
-        self.hw = PiHardware(media_root=media_root)
+        self.hw = PiHardware(media_root=media_root, log_enabled=DEBUG)
+        # Check the driver surface once at boot so the loop can use plain attribute
+        # access instead of defensive getattr()/hasattr() per iteration.
+        for name in _REQUIRED_HW_METHODS:
+            assert callable(getattr(self.hw, name, None)), name
+        assert hasattr(self.hw, "track_started_at")
         self.core = RadioCore(self.hw)
         self.last_button = 1
-        self.press_start = 0
         self.rail2_on = False
-        self.last_sense = 0
+        # Power-sense levels pushed from the GPIO edge thread, drained by the main loop.
+        self._power_events = deque()
+        self._power_edges = False
+        self._power_recheck_ms = 0
         self.prev_playing = False
+        # Last hw.track_started_at seen, and whether that start still owes its first
+        # post-settle is_playing() check.
+        self._track_started_at = self.hw.track_started_at
+        self._start_unchecked = False
         self._pending_am_overlay = False
 
     def wait_for_power(self):
         print("Waiting for power sense HIGH...")
+        # Block on a GPIO edge instead of spinning; fall back to a 20 ms poll when
+        # the driver cannot deliver edges (no RPi.GPIO).
+        powered = threading.Event()
+        has_edges = self.hw.set_power_edge_callback(
+            lambda on: powered.set() if on else None
+        )
+        wait_s = 1.5 if has_edges else 0.02
         last_hint = ticks_ms()
         while not self.hw.is_power_on():
-            if ticks_diff(ticks_ms(), last_hint) > 1500:
-                print("...still waiting for power")
+            if powered.wait(wait_s):
+                break
+            if ticks_diff(ticks_ms(), last_hint) >= 1500:
+                log("...still waiting for power")
                 last_hint = ticks_ms()
-            time.sleep(0.02)
         print("Power detected.")
         self.rail2_on = True
-        self.last_sense = 1
+        # From here on power transitions arrive as edge events (see handle_power_events).
+        self._power_edges = self.hw.set_power_edge_callback(self._power_events.append)
 
     def boot_sequence(self):
         self.hw.reset_dfplayer()
@@ -56,34 +107,34 @@ class VintageRadioFirmwarePi:
             folder = tr.get("folder", 1)
             track = tr.get("track_number", 1)
         else:
-            folder = self.core.current_album_index + 1
+            folder = self.core.current_folder
             track = self.core.current_track
         confirmed = self.hw.start_with_am(folder, track)
         if confirmed:
-            print("Boot playback confirmed")
+            log("Boot playback confirmed")
         else:
             self.hw.reset_dfplayer()
             self.hw.set_volume(100)
             time.sleep(POST_CMD_GUARD_MS / 1000.0)
             self.hw.play_track(folder, track)
 
-    def handle_button(self):
+    def handle_button(self, now):
         curr = 0 if self.hw.is_button_pressed() else 1
-        now = ticks_ms()
         if self.last_button == 1 and curr == 0:
-            self.press_start = now
-            self.core.on_button_press()
-        elif self.last_button == 0 and curr == 1:
-            old_mode = self.core.mode
-            old_shuffle_source = getattr(self.core, "_shuffle_source_type", None)
-            self.core.on_button_release()
-            new_shuffle_source = getattr(self.core, "_shuffle_source_type", None)
-            mode_changed = old_mode != self.core.mode
+            self.core.on_button_press(now)
+        elif self.last_button == 0 and curr == 1 and self.core.button_down:
+            # Only act on releases of presses the core accepted (not debounced away),
+            # timed from the core's own press start.
+            old_mode_id = self.core.mode_id
+            old_shuffle_source = self.core._shuffle_source_type
+            self.core.on_button_release(now)
+            new_shuffle_source = self.core._shuffle_source_type
+            mode_changed = old_mode_id != self.core.mode_id
             shuffle_reshuffled = (
-                self.core.mode == MODE_SHUFFLE
+                self.core.mode_id == MODE_ID_SHUFFLE
                 and old_shuffle_source != new_shuffle_source
             )
-            press_dur = ticks_diff(now, self.press_start)
+            press_dur = ticks_diff(now, self.core.press_start_ms)
             if press_dur >= LONG_PRESS_MS and self.core.tap_count == 0:
                 self._handle_album_change_with_am()
             elif mode_changed or shuffle_reshuffled:
@@ -92,65 +143,98 @@ class VintageRadioFirmwarePi:
                     folder = tr.get("folder", 1)
                     track = tr.get("track_number", 1)
                 else:
-                    folder = self.core.current_album_index + 1
+                    folder = self.core.current_folder
                     track = self.core.current_track
                 self.hw.start_with_am(folder, track)
             time.sleep(0.04)
         self.last_button = curr
 
     def _handle_album_change_with_am(self):
-        folder = self.core.current_album_index + 1
+        folder = self.core.current_folder
         track = self.core.current_track
         if self.hw.has_track(folder, track):
             self.hw.start_with_am(folder, track)
         else:
-            print("Album not found, wrapping to album 1.")
+            log("Album not found, wrapping to album 1.")
             self.core.current_album_index = 0
             self.core.current_track = 1
             self.core._save_state("wrap to album 1")
             self.hw.start_with_am(1, 1)
 
-    def handle_track_finished(self):
+    def handle_track_finished(self, now):
         if not self.rail2_on:
             return
-        if time.monotonic() < self.hw.ignore_busy_until:
-            self.prev_playing = self.hw.is_playing()
+        started = self.hw.track_started_at
+        if started != self._track_started_at:
+            # A new track was started: forget the previous one's playing state.
+            self._track_started_at = started
+            self._start_unchecked = True
+            self.prev_playing = False
+        if ticks_diff(now, started) < TRACK_SETTLE_MS:
+            # Track started moments ago and VLC state is still settling: skip the query.
             return
         playing = self.hw.is_playing()
-        if self.prev_playing and not playing:
-            print("Track finished")
-            self.core.on_track_finished()
+        # The first check after the settle window also reports a track that already
+        # ended inside it (shorter than TRACK_SETTLE_MS), though no rising edge was seen.
+        finished = not playing and (self.prev_playing or self._start_unchecked)
+        self._start_unchecked = False
         self.prev_playing = playing
+        if finished:
+            log("Track finished")
+            self.core.on_track_finished()
 
-    def handle_power_change(self):
-        sense = 1 if self.hw.is_power_on() else 0
-        if sense != self.last_sense:
-            if sense == 0:
-                print("Power OFF")
-                self.rail2_on = False
-                self.core.power_off()
-            else:
-                print("Power ON")
-                self.rail2_on = True
-                self.hw.reset_dfplayer()
-                self.core.power_on_handler()
-                folder = self.core.current_album_index + 1
-                track = self.core.current_track
-                self.hw.start_with_am(folder, track)
-            self.last_sense = sense
+    def handle_power_events(self, now):
+        if not self._power_edges:
+            self._apply_power(self.hw.is_power_on())
+            return
+        events = self._power_events
+        while events:
+            self._apply_power(events.popleft())
+        # An edge callback samples the pin inside the 50 ms debounce window, so a
+        # bouncing switch can leave a stale level queued while the real edge is
+        # suppressed; an edge before the callback was attached is lost outright.
+        # Re-reading the pin on a slow timer applies any such missed transition.
+        if ticks_diff(now, self._power_recheck_ms) >= POWER_RECHECK_MS:
+            self._power_recheck_ms = now
+            self._apply_power(self.hw.is_power_on())
+
+    def _apply_power(self, on):
+        if on == self.rail2_on:
+            return
+        if on:
+            self._power_on()
+        else:
+            self._power_off()
+
+    def _power_off(self):
+        print("Power OFF")
+        self.rail2_on = False
+        self.core.power_off()
+
+    def _power_on(self):
+        print("Power ON")
+        self.rail2_on = True
+        self.hw.reset_dfplayer()
+        self.core.power_on_handler()
+        folder = self.core.current_folder
+        track = self.core.current_track
+        self.hw.start_with_am(folder, track)
 
     def run(self):
         print("Button active. Patterns: tap=next, double=prev, triple=restart, hold=next album, etc.")
         while True:
-            self.handle_button()
-            self.core.tick()
-            self.handle_track_finished()
-            self.handle_power_change()
-            time.sleep(0.01)
+            # One clock read per pass, shared by every handler below.
+            now = ticks_ms()
+            self.handle_button(now)
+            did_work = self.core.tick(now)
+            self.handle_track_finished(now)
+            self.handle_power_events(now)
+            # Only yield (no 10 ms stall) right after tick() changed state, so the
+            # follow-up busy/power edges are picked up on the next pass.
+            time.sleep(0 if did_work else 0.01)
 
 
 def main():
-    import os
     media_root = os.environ.get("VINTAGE_RADIO_MEDIA_ROOT")
     firmware = VintageRadioFirmwarePi(media_root=media_root)
     firmware.wait_for_power()
@@ -14,7 +14,7 @@ import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from radio_core import HardwareInterface, FADE_IN_S
+from radio_core import HardwareInterface, FADE_IN_S, ticks_ms
 from pin_config_loader import load_pin_config
 
 # Configurable paths (set before instantiating or via env)
@@ -23,6 +23,10 @@ VINTAGE_DIR = Path(MEDIA_ROOT) / "VintageRadio"
 ALBUM_FILE = str(VINTAGE_DIR / "album_state.txt")
 METADATA_FILE = str(VINTAGE_DIR / "radio_metadata.json")
 WAV_FILE = str(VINTAGE_DIR / "AMradioSound.wav")
+# Pi-only resume data kept beside ALBUM_FILE, whose format stays shared with the
+# DFPlayer build.
+RESUME_FILE = str(VINTAGE_DIR / "resume_state.json")
+RESUME_KEYS = ("mode", "shuffle_source", "shuffle_order", "radio_offsets")
 
 # GPIO pin numbers from config (BCM); falls back to defaults matching Pico layout
 _cfg = load_pin_config()
@@ -44,6 +48,67 @@ except ImportError:
     GPIO_AVAILABLE = False
 
 
+def _encode_state(state_dict: Dict) -> str:
+    """album_state.txt payload: ``album,track;tracks=a:c,...`` with a 1-based album."""
+    album_idx = state_dict.get("album_index", 0) + 1
+    track = state_dict.get("track", 1)
+    known = state_dict.get("known_tracks", {})
+    track_str = ",".join(f"{a}:{c}" for a, c in sorted(known.items()))
+    return f"{album_idx},{track};tracks={track_str}"
+
+
+def _decode_state(raw: str) -> Optional[Dict]:
+    """Parse an album_state.txt payload; None when the album,track field is malformed."""
+    parts = raw.strip().split(";")
+    try:
+        a_str, t_str = parts[0].split(",")
+        album_idx = int(a_str) - 1
+        track = int(t_str)
+    except (ValueError, IndexError):
+        return None
+    known_tracks = {}
+    if len(parts) > 1 and parts[1].startswith("tracks="):
+        for pair in parts[1][7:].split(","):
+            if not pair:
+                continue
+            try:
+                a, c = pair.split(":")
+                known_tracks[int(a)] = int(c)
+            except ValueError:
+                pass
+    return {
+        "mode": "album",
+        "album_index": album_idx,
+        "track": track,
+        "known_tracks": known_tracks,
+    }
+
+
+def _encode_resume(state_dict: Dict) -> str:
+    """resume_state.json payload: the RESUME_KEYS present in ``state_dict``."""
+    return json.dumps({k: state_dict[k] for k in RESUME_KEYS if k in state_dict})
+
+
+def _decode_resume(raw: str) -> Dict:
+    """RESUME_KEYS found in a resume_state.json payload; {} when it is unreadable."""
+    try:
+        resume = json.loads(raw)
+    except ValueError:
+        return {}
+    if not isinstance(resume, dict):
+        return {}
+    return {k: resume[k] for k in RESUME_KEYS if k in resume}
+
+
+def _write_atomic(path: str, payload: str) -> None:
+    """Write a sibling temp file and swap it in, so losing power mid-write leaves the
+    previous file intact instead of a truncated one."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
 def _resolve_sd_path(sd_path: Optional[str]) -> Optional[str]:
     """Convert metadata sd_path to local path using MEDIA_ROOT."""
     if not sd_path:
@@ -65,14 +130,18 @@ class PiHardware(HardwareInterface):
     button/power, same state/metadata files as DFPlayer build.
     """
 
-    def __init__(self, media_root: Optional[str] = None) -> None:
-        global MEDIA_ROOT, VINTAGE_DIR, ALBUM_FILE, METADATA_FILE, WAV_FILE
+    def __init__(self, media_root: Optional[str] = None, log_enabled: bool = True) -> None:
+        global MEDIA_ROOT, VINTAGE_DIR, ALBUM_FILE, RESUME_FILE, METADATA_FILE, WAV_FILE
         if media_root is not None:
             MEDIA_ROOT = media_root
             VINTAGE_DIR = Path(MEDIA_ROOT) / "VintageRadio"
             ALBUM_FILE = str(VINTAGE_DIR / "album_state.txt")
+            RESUME_FILE = str(VINTAGE_DIR / "resume_state.json")
             METADATA_FILE = str(VINTAGE_DIR / "radio_metadata.json")
             WAV_FILE = str(VINTAGE_DIR / "AMradioSound.wav")
+        # Read by RadioCore to skip building per-event log lines; main_pi passes its
+        # DEBUG switch.
+        self.log_enabled = log_enabled
         self._player: Optional[Any] = None
         self._instance: Optional[Any] = None
         self._volume = 100
@@ -81,9 +150,12 @@ class PiHardware(HardwareInterface):
         self._known_tracks: Dict[int, int] = {}
         self._songs_sd_path: Dict[str, str] = {}
         self._folder_track_to_song: Dict[tuple, int] = {}
+        self._track_set: set = set()  # (folder, track) pairs whose file exists on media
         self._am_overlay_active = False
         self._delay_playback = False
-        self.ignore_busy_until = 0.0  # time.monotonic() until we ignore track-finished
+        self.track_started_at = ticks_ms()  # ticks_ms() of the last successful play_track()
+        self._power_edge_cb = None
+        self._power_edge_armed = False
         if VLC_AVAILABLE:
             self._instance = vlc.Instance("--no-xlib")
             self._player = self._instance.media_player_new()
@@ -166,8 +238,17 @@ class PiHardware(HardwareInterface):
                 else:
                     self._albums.append(entry)
 
+        self._rebuild_track_set()
         self.log(f"Loaded metadata: {len(self._albums)} albums, {len(self._playlists)} playlists")
 
+    def _rebuild_track_set(self) -> None:
+        """Stat every mapped track file once so has_track() is a set lookup."""
+        self._track_set = set()
+        for key in self._folder_track_to_song:
+            path = self._path_for(*key)
+            if path is not None and os.path.isfile(path):
+                self._track_set.add(key)
+
     def _path_for(self, folder: int, track: int) -> Optional[str]:
         song_id = self._folder_track_to_song.get((folder, track))
         if song_id is None:
@@ -175,8 +256,7 @@ class PiHardware(HardwareInterface):
         return self._songs_sd_path.get(str(song_id))
 
     def has_track(self, folder: int, track: int) -> bool:
-        path = self._path_for(folder, track)
-        return path is not None and os.path.isfile(path)
+        return (folder, track) in self._track_set
 
     def set_delay_playback(self, delay: bool) -> None:
         """When True, play_track() no-ops so firmware can run start_with_am() first."""
@@ -203,7 +283,7 @@ class PiHardware(HardwareInterface):
             self._player.set_time(start_ms)
         else:
             self._player.play()
-        self.ignore_busy_until = time.monotonic() + 2.0
+        self.track_started_at = ticks_ms()
         return True
 
     def stop(self) -> None:
@@ -251,57 +331,32 @@ class PiHardware(HardwareInterface):
     def save_state(self, state_dict: Dict) -> None:
         try:
             Path(ALBUM_FILE).parent.mkdir(parents=True, exist_ok=True)
-            album_idx = state_dict.get("album_index", 0) + 1
-            track = state_dict.get("track", 1)
-            known = state_dict.get("known_tracks", {})
-            track_str = ",".join(f"{a}:{c}" for a, c in sorted(known.items()))
-            payload = f"{album_idx},{track};tracks={track_str}"
-            with open(ALBUM_FILE, "w", encoding="utf-8") as f:
-                f.write(payload)
+            _write_atomic(ALBUM_FILE, _encode_state(state_dict))
+            _write_atomic(RESUME_FILE, _encode_resume(state_dict))
         except Exception as e:
             self.log(f"State save error: {e}")
 
     def load_state(self) -> Optional[Dict]:
         self._load_metadata()
-        state = {}
         try:
             with open(ALBUM_FILE, "r", encoding="utf-8") as f:
-                raw = f.read().strip()
+                state = _decode_state(f.read())
         except Exception:
+            state = None
+        if state is None:
             return {
                 "mode": "album",
                 "album_index": 0,
                 "track": 1,
                 "known_tracks": dict(self._known_tracks),
             }
-        parts = raw.split(";")
+        # Mode, shuffle order and radio offsets; absent on files from older builds.
         try:
-            a_str, t_str = parts[0].split(",")
-            album_idx = int(a_str) - 1
-            track = int(t_str)
-        except (ValueError, IndexError):
-            return {
-                "mode": "album",
-                "album_index": 0,
-                "track": 1,
-                "known_tracks": dict(self._known_tracks),
-            }
-        known_tracks = {}
-        if len(parts) > 1 and parts[1].startswith("tracks="):
-            for pair in parts[1][7:].split(","):
-                if not pair:
-                    continue
-                try:
-                    a, c = pair.split(":")
-                    known_tracks[int(a)] = int(c)
-                except ValueError:
-                    pass
-        return {
-            "mode": "album",
-            "album_index": album_idx,
-            "track": track,
-            "known_tracks": known_tracks,
-        }
+            with open(RESUME_FILE, "r", encoding="utf-8") as f:
+                state.update(_decode_resume(f.read()))
+        except OSError:
+            pass
+        return state
 
     def log(self, message: str) -> None:
         print(message)
@@ -328,6 +383,32 @@ class PiHardware(HardwareInterface):
             return GPIO.input(PIN_SENSE) == 1
         return True
 
+    def set_power_edge_callback(self, callback) -> bool:
+        """Call ``callback(is_on)`` from the GPIO thread on power-sense edges.
+
+        Pass None to detach. Returns False when edge detection is unavailable,
+        in which case the caller has to keep polling is_power_on().
+        """
+        self._power_edge_cb = callback
+        if not GPIO_AVAILABLE:
+            return False
+        if not self._power_edge_armed:
+            try:
+                GPIO.add_event_detect(
+                    PIN_SENSE, GPIO.BOTH, callback=self._on_power_edge, bouncetime=50
+                )
+            except RuntimeError as e:
+                # "Failed to add edge detection" on GPIO stacks without edge support
+                self.log(f"Power-sense edge detection unavailable, polling instead: {e}")
+                return False
+            self._power_edge_armed = True
+        return True
+
+    def _on_power_edge(self, _channel) -> None:
+        cb = self._power_edge_cb
+        if cb is not None:
+            cb(self.is_power_on())
+
     def is_button_pressed(self) -> bool:
         if GPIO_AVAILABLE:
             return GPIO.input(PIN_BUTTON) == 0
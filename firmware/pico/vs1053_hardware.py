@@ -681,8 +681,10 @@ class VS1053Hardware(HardwareInterface):
         if self._vol_smoothed < 1300:
             new_vol = 0
         else:
-            new_vol = min(int((self._vol_smoothed / 65535.0) * 100), 100)
-        if abs(new_vol - self._volume) >= 2:
+            new_vol = min(self._vol_smoothed * 100 // 65535, 100)
+        # Integer-only: no float or abs() call on this 20 Hz poll
+        diff = new_vol - self._volume
+        if diff >= 2 or diff <= -2:
             self._volume = new_vol
             self._apply_volume()
 
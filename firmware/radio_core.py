@@ -13,21 +13,57 @@ Compatible with both MicroPython and CPython.
 
 # Try MicroPython time, fall back to CPython
 try:
-    from time import ticks_ms, ticks_diff, sleep_ms as _sleep_ms
+    from time import ticks_ms, ticks_diff, ticks_add, sleep_ms as _sleep_ms
 except ImportError:
     import time as _time
     def ticks_ms():
         return int(_time.monotonic() * 1000)
     def ticks_diff(a, b):
         return a - b
+    def ticks_add(a, b):
+        return a + b
     def _sleep_ms(ms):
         _time.sleep(ms / 1000.0)
 
+from array import array
+
+# MicroPython ships no bisect module
+try:
+    from bisect import bisect_right
+except ImportError:
+    def bisect_right(seq, x):
+        lo, hi = 0, len(seq)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if x < seq[mid]:
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
 # Try MicroPython random
 try:
     from urandom import randint
 except ImportError:
     from random import randint
+# randrange(n) skips randint's extra argument handling; not every port ships it
+try:
+    from urandom import randrange
+except ImportError:
+    try:
+        from random import randrange
+    except ImportError:
+        def randrange(n):
+            return randint(0, n - 1)
+# CPython's shuffle runs the Fisher-Yates pass in C; MicroPython's random has none
+try:
+    from random import shuffle as _shuffle
+except ImportError:
+    def _shuffle(seq):
+        rand = randint
+        for i in range(len(seq) - 1, 0, -1):
+            j = rand(0, i)
+            seq[i], seq[j] = seq[j], seq[i]
 try:
     import sys as _sys
     _IS_MICROPYTHON = getattr(getattr(_sys, "implementation", None), "name", "") == "micropython"
@@ -48,7 +84,12 @@ LONG_PRESS_MS = 500   # Hold >= 500ms = long press
 TAP_WINDOW_MS = 350   # ms after last release to resolve taps (single-tap next/prev feels snappier; double-tap still detectable)
 BUSY_CONFIRM_MS = 2200
 POST_CMD_GUARD_MS = 120
+DEBOUNCE_MS = 20      # A press edge closer than this to the previous accepted edge is contact bounce
+DIAL_JITTER = 2       # Dial moves smaller than this (0-100 units) within DIAL_SETTLE_MS are ADC noise
+DIAL_SETTLE_MS = 150
 MAX_ALBUM_NUM = 99
+DEFAULT_TRACK_MS = 180000  # Radio timeline length for tracks with unknown duration
+DEBUG_RADIO = False   # Per-dial-move [RADIO DEBUG] trace in tune_radio (formatted only when set)
 
 
 def _agent_debug_ndjson(hypothesis_id, message, data):
@@ -83,6 +124,12 @@ MODE_RADIO = "radio"
 
 ALL_MODES = [MODE_ALBUM, MODE_PLAYLIST, MODE_SHUFFLE, MODE_RADIO]
 
+# Integer ids mirrored on RadioCore.mode_id for cheap compares in polling loops.
+# The string constants stay the persisted/serialized form.
+MODE_IDS = {MODE_ALBUM: 0, MODE_PLAYLIST: 1, MODE_SHUFFLE: 2, MODE_RADIO: 3}
+MODE_ID_SHUFFLE = MODE_IDS[MODE_SHUFFLE]
+MODE_ID_RADIO = MODE_IDS[MODE_RADIO]
+
 # Persisted on Pico flash (alongside album_state.txt).
 # Tuple: (DFPlayer folder_count from 0x4F or -1, number of discovered stations).
 BASIC_SD_SIG_FILE = "VintageRadio/basic_sd_sig.txt"
@@ -113,14 +160,131 @@ def _format_basic_sd_sig(sig):
 # ===========================
 #      RADIO STATION
 # ===========================
+# track_duration_ms, cumulative_ms, track_at_position and dial_to_station_idx are
+# public: the GUI emulator (gui/test_mode.py) builds its stations with them.
+
+def _duration_field_ms(track):
+    """Timeline length in ms from a track dict's ``duration`` (unknown/zero -> DEFAULT_TRACK_MS)."""
+    ms = int((track.get('duration', 0) or 0) * 1000)
+    if ms <= 0:
+        ms = DEFAULT_TRACK_MS
+    return ms
+
+
+def track_duration_ms(track):
+    """Timeline length of a track dict in ms (unknown/zero duration -> DEFAULT_TRACK_MS).
+
+    Uses the ``_dur_ms`` value stamped by RadioCore._load_data when present.
+    """
+    ms = track.get('_dur_ms')
+    if ms is None:
+        ms = _duration_field_ms(track)
+    return ms
+
+
+def cumulative_ms(durations_ms):
+    """Running end offset of each timeline entry: cum_ms[i] = sum(durations_ms[:i + 1])."""
+    cum_ms = array('L')
+    end = 0
+    for dur in durations_ms:
+        end += dur
+        cum_ms.append(end)
+    return cum_ms
+
+
+def track_at_position(cum_ms, position_ms):
+    """(index, offset within that track) for a position on a cumulative_ms() timeline.
+
+    Positions past the end of the timeline map to the start of track 0.
+    """
+    # First track whose end lies past the position
+    i = bisect_right(cum_ms, position_ms)
+    if i < len(cum_ms):
+        return i, position_ms - (cum_ms[i - 1] if i else 0)
+    return 0, 0
+
+
+def _track_play_key(track):
+    """(folder, track_number) a track dict is played by.
+
+    Uses the ``_play_key`` stamped by RadioCore._load_data when present; tracks built
+    elsewhere (basic-mode stations, the full library) are resolved on the spot.
+    """
+    key = track.get('_play_key')
+    if key is None:
+        key = (track.get('folder', 1), track.get('track_number', 1))
+    return key
+
+
+def _track_display(track):
+    """(title, artist) shown for a track dict; ``_display`` is stamped by _load_data."""
+    display = track.get('_display')
+    if display is None:
+        display = (track.get('title', 'Unknown'), track.get('artist', 'Unknown'))
+    return display
+
+
+def _stamp_track(track):
+    """Resolve ``_dur_ms``, ``_play_key`` and ``_display`` onto a track dict.
+
+    Always overwrites: the driver may hand back dicts stamped by an earlier load
+    whose duration, address or title/artist have since changed.
+    """
+    track['_dur_ms'] = _duration_field_ms(track)
+    track['_play_key'] = (track.get('folder', 1), track.get('track_number', 1))
+    track['_display'] = (track.get('title', 'Unknown'), track.get('artist', 'Unknown'))
+
+
+def _safe_get(seq, idx):
+    """``seq[idx]`` when idx is a valid non-negative index, else None."""
+    return seq[idx] if seq and 0 <= idx < len(seq) else None
+
+
+def dial_to_station_idx(dial_value, max_idx):
+    """Map a 0-100 dial reading to the nearest station index in [0, max_idx].
+
+    Scales before truncating, so fractional readings keep their position; integer
+    readings stay in integer math and allocate no floats.
+    """
+    return max(0, min(int((dial_value * max_idx + 50) // 100), max_idx))
+
 
 class RadioStation:
     """A radio station representing a collection of tracks."""
+    # One instance per album/playlist: no per-instance __dict__
+    __slots__ = ('name', 'tracks', 'start_offset_ms', 'durations_ms', 'cum_ms', 'total_duration_ms')
+
     def __init__(self, name, tracks, total_duration_ms=0, start_offset_ms=0):
         self.name = name
         self.tracks = tracks  # List of track dicts with at least 'duration' key
-        self.total_duration_ms = total_duration_ms
         self.start_offset_ms = start_offset_ms
+        # Flat int column of per-track timeline lengths, parallel to ``tracks``, so
+        # virtual-time scans read packed ints instead of two dict lookups per track.
+        self.durations_ms = array('I', [track_duration_ms(t) for t in (tracks or ())])
+        # Running end offset of each track, for bisecting the timeline.
+        self.cum_ms = cumulative_ms(self.durations_ms)
+        # Timeline length, fixed at construction: the end of the last track unless given
+        # explicitly. Never 0, so position_at() can always take the modulo.
+        end = self.cum_ms[-1] if len(self.cum_ms) else 0
+        self.total_duration_ms = total_duration_ms or end or 1
+
+    def track_at(self, position_ms):
+        """(index into ``tracks``, offset within that track) for a timeline position.
+
+        Positions past the end of the timeline map to the start of track 0.
+        """
+        return track_at_position(self.cum_ms, position_ms)
+
+    def position_at(self, elapsed_ms):
+        """Virtual timeline position after ``elapsed_ms`` of radio time.
+
+        Equivalent to ``(start_offset_ms + elapsed_ms) % total_duration_ms``, but the
+        modulo only runs once the station has actually wrapped.
+        """
+        pos = self.start_offset_ms + elapsed_ms
+        if pos >= self.total_duration_ms or pos < 0:
+            pos %= self.total_duration_ms
+        return pos
 
 
 # ===========================
@@ -222,6 +386,10 @@ class HardwareInterface:
         """Output a log/debug message (e.g. print to serial)."""
         raise NotImplementedError
 
+    # Set False to have RadioCore skip building its per-event chatter
+    # (button edges, playback starts, radio advances). Read once at core init.
+    log_enabled = True
+
     # ---- Metadata ----
 
     def get_albums(self):
@@ -364,6 +532,17 @@ class RadioCore:
         """
         self.hw = hardware
         self.basic_mode = basic_mode
+        # Optional driver hooks, probed once instead of per playback/transition.
+        self._hw_has_delay = hasattr(hardware, "set_delay_playback")
+        self._hw_has_delay_reason = hasattr(hardware, "set_delay_playback_reason")
+        self._hw_has_track_hint = hasattr(hardware, "set_current_track_hint")
+        self._hw_has_start_outcome = callable(getattr(hardware, "get_last_start_outcome", None))
+        self._log_on = bool(getattr(hardware, "log_enabled", True))
+        # Album/playlist track list resolved by _get_current_tracks() and the mode_id it
+        # was resolved in. Cleared whenever the album index changes and explicitly
+        # wherever the library or a collection's track list is replaced.
+        self._current_tracks = None
+        self._current_tracks_mode_id = -1
         
         # Current state
         self.mode = MODE_PLAYLIST if basic_mode else MODE_ALBUM
@@ -384,8 +563,17 @@ class RadioCore:
         self.radio_stations = []
         self.radio_station_index = 0
         self.radio_mode_start_ms = None
+        # Stations by name from earlier _init_radio() calls: their timelines are reused
+        # while the source track list is the same, so re-entering radio costs no
+        # per-track work. Cleared whenever the library is (re)loaded.
+        self._station_cache = {}
         # Cooldown so tick does not override a recent tune or force-advance (avoids ping-pong/wrong start)
-        self._radio_advance_cooldown_until_ms = 0
+        # ticks_ms() deadline; None once it has passed, so a stale value cannot look
+        # like a future one after ticks_ms() wraps.
+        self._radio_advance_cooldown_until_ms = None
+        # Last dial reading tune_radio() acted on, and when (for jitter rejection)
+        self._last_tune_dial = None
+        self._last_tune_ms = 0
         
         # Track the source type when entering shuffle mode (for "shuffle current" functionality)
         self._shuffle_source_type = None  # 'album' or 'playlist'
@@ -394,17 +582,56 @@ class RadioCore:
         self.tap_count = 0
         self.press_start_ms = 0
         self.last_release_ms = 0
+        # Absolute ticks_ms() deadlines checked by tick(); None = nothing pending.
+        self._tap_deadline_ms = None
+        self._radio_next_check_ms = 0
         self.button_down = False
+        # ticks_ms() of the last accepted button edge; None until the first one
+        self._last_edge_ms = None
         self._pending_long_press = False
+        # (tap_count, had_hold) -> gesture handler, resolved in one lookup after the
+        # tap window. Tap-only counts above 5 clamp to the five-tap gesture.
+        self._input_dispatch = {
+            (1, False): self._single_tap,
+            (2, False): self._double_tap,
+            (3, False): self._triple_tap,
+            (4, False): self._prev_album,
+            (5, False): self._five_tap_first_station,
+            (0, True): self._next_album,
+            (1, True): self._one_tap_hold,
+            (2, True): self._two_tap_hold,
+            (3, True): self._five_tap_hold_shuffle_first_station,
+        }
+        # Mode-entry step run by switch_mode(); album/playlist share the ordered path.
+        self._mode_enter = {
+            MODE_SHUFFLE: self._enter_shuffle_mode,
+            MODE_RADIO: self._enter_radio_mode,
+        }
+        # Status 'source' label per mode; unlisted modes use the album name.
+        self._source_name_resolvers = {
+            MODE_PLAYLIST: self._source_name_playlist,
+            MODE_SHUFFLE: self._source_name_shuffle,
+            MODE_RADIO: self._source_name_radio,
+        }
+        
+        # (mode, album index, folder, track_number) of the last track that actually
+        # started playing
+        self._playing_track_key = None
         
         # Resume state (for power off/on)
         self.resume_state = None
+        # Shuffle order (track ids) and radio start offsets from the last boot's saved
+        # state; consumed once by _init_current_shuffle / _init_radio.
+        self._resume_shuffle_ids = None
+        self._resume_radio_offsets = None
         
         # Volume
         self.volume = 100
         
         # Known tracks per album (for firmware compatibility)
         self.known_tracks = {}
+        # Last state handed to hw.save_state(); an identical checkpoint is not rewritten.
+        self._persisted_state = None
         # Set by _next_track when looping same station: last track -> track 1 (DFPlayer quirk)
         self._folder_wrap_play = False
         
@@ -419,6 +646,27 @@ class RadioCore:
         # (0x4F folder count or -1 if unknown, number of seeded station slots). Used to
         # detect SD swaps while power is off and trigger soft reset + fresh boot.
         self._basic_sd_signature = None
+
+    @property
+    def mode(self):
+        return self._mode
+
+    @mode.setter
+    def mode(self, value):
+        self._mode = value
+        self.mode_id = MODE_IDS.get(value, -1)
+
+    @property
+    def current_album_index(self):
+        return self._current_album_index
+
+    @current_album_index.setter
+    def current_album_index(self, value):
+        self._current_album_index = value
+        # 1-based folder number derived once per write instead of on every read.
+        self.current_folder = value + 1
+        self._current_tracks = None
+
     def _basic_playlist_track_count(self, playlist: dict) -> int:
         tracks = playlist.get("tracks", [])
         if tracks:
@@ -476,21 +724,39 @@ class RadioCore:
                     self.shuffle_tracks[i] = tr
             else:
                 self.shuffle_tracks = list(tracks)
-            for i in range(len(self.shuffle_tracks) - 1, 0, -1):
-                j = randint(0, i)
-                self.shuffle_tracks[i], self.shuffle_tracks[j] = self.shuffle_tracks[j], self.shuffle_tracks[i]
+            _shuffle(self.shuffle_tracks)
             return True
         except MemoryError:
             self._collect_heap(reason + " retry")
             try:
                 self.shuffle_tracks = list(tracks)
-                for i in range(len(self.shuffle_tracks) - 1, 0, -1):
-                    j = randint(0, i)
-                    self.shuffle_tracks[i], self.shuffle_tracks[j] = self.shuffle_tracks[j], self.shuffle_tracks[i]
+                _shuffle(self.shuffle_tracks)
                 return True
             except MemoryError:
                 return False
 
+    def _restore_shuffle_order(self, tracks, ids) -> bool:
+        """Rebuild shuffle_tracks in a saved track-id order.
+
+        Returns False (leaving shuffle_tracks untouched) when the ids no longer match
+        the source tracks one-to-one, e.g. after a library change.
+        """
+        if len(ids) != len(tracks):
+            return False
+        by_id = {}
+        for tr in tracks:
+            by_id[tr.get('id')] = tr
+        if len(by_id) != len(tracks):
+            return False
+        order = []
+        for tid in ids:
+            tr = by_id.get(tid)
+            if tr is None:
+                return False
+            order.append(tr)
+        self.shuffle_tracks = order
+        return True
+
     def _next_station_index(self) -> int:
         """Next station index in SD/folder order (basic mode)."""
         n = len(self.playlists)
@@ -685,6 +951,8 @@ class RadioCore:
     
     def _load_data(self):
         """Load albums, playlists, and tracks from hardware."""
+        self._station_cache = {}
+        self._current_tracks = None
         if self.basic_mode:
             self._load_data_basic()
             return
@@ -695,6 +963,10 @@ class RadioCore:
         if not self.albums:
             all_tracks = self.hw.get_all_tracks() or []
             self.albums = [{'id': 0, 'name': 'Library', 'tracks': all_tracks}]
+        
+        for coll in self.albums + self.playlists:
+            for t in coll.get('tracks', ()):
+                _stamp_track(t)
 
     def _load_data_basic(self):
         """Load station data by querying DFPlayer folder structure.
@@ -812,6 +1084,10 @@ class RadioCore:
             self.known_tracks = known
             if hasattr(self.hw, "_known_tracks"):
                 self.hw._known_tracks = dict(known)
+            if self.mode == MODE_SHUFFLE and not self.basic_mode:
+                self._shuffle_source_type = state.get('shuffle_source')
+                self._resume_shuffle_ids = state.get('shuffle_order')
+            self._resume_radio_offsets = state.get('radio_offsets')
             # Clamp album/playlist index to valid range (metadata may have changed since state was saved)
             if self.mode == MODE_PLAYLIST and self.playlists:
                 if self.current_album_index >= len(self.playlists):
@@ -841,12 +1117,28 @@ class RadioCore:
                     self._defer_basic_shuffle_rebuild = True
                 else:
                     self._init_shuffle()
+            # What was just loaded is what the file holds: an unchanged power-off
+            # checkpoint need not rewrite it.
+            self._persisted_state = self._state_snapshot()
     
     def _save_state(self, reason="", persist=None):
-        """Capture runtime state; persist to flash only when requested.
+        """Persist state to flash when requested.
 
-        By default, persistence is pot-off checkpoint only.
+        By default, persistence is pot-off checkpoint only: calls from track, album and
+        mode changes return without building anything, since the power-off write
+        captures their result anyway. A checkpoint equal to the last one written is
+        skipped to spare the flash.
         """
+        should_persist = (reason == "power off") if persist is None else bool(persist)
+        if not should_persist:
+            return
+        state = self._state_snapshot()
+        if state != self._persisted_state:
+            self.hw.save_state(state)
+            self._persisted_state = state
+
+    def _state_snapshot(self):
+        """State dict handed to hw.save_state()."""
         state = {
             'mode': self.mode,
             'album_index': self.current_album_index,
@@ -854,85 +1146,118 @@ class RadioCore:
         }
         if not _IS_MICROPYTHON:
             state['known_tracks'] = dict(self.known_tracks)
-        self._runtime_state = dict(state)
-        should_persist = (reason == "power off") if persist is None else bool(persist)
-        if should_persist:
-            self.hw.save_state(state)
+            # Resume the same shuffle order and radio timeline on the next boot. Saved
+            # values not yet consumed this boot are carried over unchanged.
+            if self.mode == MODE_SHUFFLE:
+                if self.shuffle_tracks:
+                    state['shuffle_source'] = self._shuffle_source_type
+                    state['shuffle_order'] = [tr.get('id') for tr in self.shuffle_tracks]
+                elif self._resume_shuffle_ids:
+                    state['shuffle_source'] = self._shuffle_source_type
+                    state['shuffle_order'] = self._resume_shuffle_ids
+            if self.radio_stations:
+                state['radio_offsets'] = [st.start_offset_ms for st in self.radio_stations]
+            elif self._resume_radio_offsets:
+                state['radio_offsets'] = self._resume_radio_offsets
+        return state
     
     # ===========================
     #   BUTTON HANDLING
     # ===========================
     
-    def on_button_press(self):
-        """Called when button is pressed down."""
+    def on_button_press(self, now=None):
+        """Called when button is pressed down. ``now`` is an optional ticks_ms() snapshot."""
         if not self.power_on:
             return
+        if now is None:
+            now = ticks_ms()
+        last_edge = self._last_edge_ms
+        if last_edge is not None and ticks_diff(now, last_edge) < DEBOUNCE_MS:
+            return
+        self._last_edge_ms = now
         # New press always resets the idle timer - we're receiving input
         self.button_down = True
-        self.press_start_ms = ticks_ms()
-        self.hw.log(f"on_button_press: down (existing tap_count={self.tap_count})")
+        self.press_start_ms = now
+        if self._log_on:
+            self.hw.log(f"on_button_press: down (existing tap_count={self.tap_count})")
     
-    def on_button_release(self):
-        """Called when button is released."""
+    def on_button_release(self, now=None):
+        """Called when button is released. ``now`` is an optional ticks_ms() snapshot.
+
+        Releases are never debounced: drivers report level changes only, so a dropped
+        release would leave ``button_down`` set with no later edge to clear it. Bounce
+        after the release is rejected on the press side instead.
+        """
         if not self.power_on or not self.button_down:
             return
+        if now is None:
+            now = ticks_ms()
+        self._last_edge_ms = now
         self.button_down = False
         
-        now = ticks_ms()
         press_duration = ticks_diff(now, self.press_start_ms)
         
         if press_duration >= LONG_PRESS_MS:
             # This was a hold (long press). Record it and start the 500ms idle timer.
-            self.hw.log(f"on_button_release: HOLD detected ({press_duration}ms), tap_count={self.tap_count}")
+            if self._log_on:
+                self.hw.log(f"on_button_release: HOLD detected ({press_duration}ms), tap_count={self.tap_count}")
             self._pending_long_press = True
             self.last_release_ms = now
+            self._tap_deadline_ms = ticks_add(now, TAP_WINDOW_MS)
         else:
             # This was a tap. Increment count and start/restart the 500ms idle timer.
             self.tap_count += 1
             self.last_release_ms = now
-            self.hw.log(f"on_button_release: TAP #{self.tap_count} ({press_duration}ms)")
+            self._tap_deadline_ms = ticks_add(now, TAP_WINDOW_MS)
+            if self._log_on:
+                self.hw.log(f"on_button_release: TAP #{self.tap_count} ({press_duration}ms)")
     
-    def tick(self):
+    def tick(self, now=None):
         """
         Called regularly (e.g., every 10-50ms) to process timing-based events.
+        ``now`` lets the caller share one ticks_ms() reading across its loop pass.
         Returns True if something happened.
         """
-        if not self.power_on:
+        # Idle fast path: powered off, or no tap window open and no radio clock to follow.
+        # Checked before reading the clock so the common case costs two attribute tests.
+        if not self.power_on or (self._tap_deadline_ms is None and self.mode_id != MODE_ID_RADIO):
             return False
         
-        now = ticks_ms()
+        if now is None:
+            now = ticks_ms()
         
-        # Wait for 500ms of no input (idle timeout) after the last release
+        # Resolve once the idle deadline (TAP_WINDOW_MS after the last release) passes
         # Only resolve if button is NOT currently held down
-        if self.last_release_ms > 0 and not self.button_down and \
-           ticks_diff(now, self.last_release_ms) >= TAP_WINDOW_MS:
+        deadline = self._tap_deadline_ms
+        if deadline is not None and not self.button_down and ticks_diff(now, deadline) >= 0:
             self._resolve_input()
             return True
         
         # Radio mode: check if track should advance based on virtual time
         # Only check every ~1 second to avoid excessive checking
-        if self.mode == MODE_RADIO and self.is_playing:
-            # Use a simple time-based throttle (check every ~1 second)
-            now = ticks_ms()
-            if not hasattr(self, '_last_radio_check_ms'):
-                self._last_radio_check_ms = now
-            if ticks_diff(now, self._last_radio_check_ms) >= 1000:  # Check every 1 second
-                self._last_radio_check_ms = now
-                if self._check_radio_advance():
-                    return True
+        if self.mode_id == MODE_ID_RADIO and self.is_playing and \
+           ticks_diff(now, self._radio_next_check_ms) >= 0:
+            self._radio_next_check_ms = ticks_add(now, 1000)
+            if self._check_radio_advance(now):
+                return True
         
         return False
     
-    def _check_radio_advance(self):
+    def _check_radio_advance(self, now=None):
         """Check if radio mode should advance to next track based on virtual time.
         Returns True if track was advanced.
         """
+        if now is None:
+            now = ticks_ms()
         if not self.radio_stations or self.radio_station_index >= len(self.radio_stations):
             return False
         
         # Do not override a recent tune or force-advance (avoids ping-pong and wrong start position)
-        if ticks_ms() < self._radio_advance_cooldown_until_ms:
-            return False
+        cooldown_until = self._radio_advance_cooldown_until_ms
+        if cooldown_until is not None:
+            if ticks_diff(now, cooldown_until) < 0:
+                return False
+            self._radio_advance_cooldown_until_ms = None
         
         station = self.radio_stations[self.radio_station_index]
         if not station.tracks:
@@ -940,19 +1265,21 @@ class RadioCore:
         
         # Calculate current virtual position
         if self.radio_mode_start_ms is None:
-            self.radio_mode_start_ms = ticks_ms()
+            self.radio_mode_start_ms = now
             return False
         
-        elapsed_ms = ticks_diff(ticks_ms(), self.radio_mode_start_ms)
-        virtual_pos_ms = (station.start_offset_ms + elapsed_ms) % station.total_duration_ms
+        elapsed_ms = ticks_diff(now, self.radio_mode_start_ms)
+        virtual_pos_ms = station.position_at(elapsed_ms)
         
         # Find which track should be playing at this virtual time
-        current_track, current_offset = self._find_track_at_position(station.tracks, virtual_pos_ms)
-        if not current_track:
-            return False
+        i, current_offset = station.track_at(virtual_pos_ms)
+        current_track = station.tracks[i]
         
         # Check if we're playing the correct track
-        current_track_idx = station.tracks.index(current_track) + 1 if current_track in station.tracks else 1
+        current_track_idx = i + 1
+        # The answer cannot change before virtual time leaves this track, so the next
+        # check is due at that boundary rather than a second from now.
+        boundary_ms = ticks_add(now, station.durations_ms[current_track_idx - 1] - current_offset)
         
         # Only advance if we've moved to a completely different track
         # Don't restart if we're on the same track (even if offset changed slightly)
@@ -963,13 +1290,17 @@ class RadioCore:
             # when the previous track finished and we force-advanced to the next track.
             # Overriding would ping-pong us back to the previous track (handles wrap: e.g. virtual=20, we're on 1).
             if self.current_track == next_after_virtual:
+                self._radio_next_check_ms = boundary_ms
                 return False
             # Virtual time says we should be on a different track and we're behind - advance
             self.current_track = current_track_idx
             self._start_playback_for_track(current_track, start_ms=current_offset)
-            self.hw.log(f"Radio advanced to track {current_track_idx} at {current_offset // 1000}s (virtual time)")
+            self._radio_next_check_ms = boundary_ms
+            if self._log_on:
+                self.hw.log(f"Radio advanced to track {current_track_idx} at {current_offset // 1000}s (virtual time)")
             return True
         
+        self._radio_next_check_ms = boundary_ms
         return False
     
     def _resolve_input(self):
@@ -987,28 +1318,24 @@ class RadioCore:
         had_hold = getattr(self, '_pending_long_press', False)
         tap_count = self.tap_count
         
-        self.hw.log(f"_resolve_input: taps={tap_count}, hold={had_hold}")
+        if self._log_on:
+            self.hw.log(f"_resolve_input: taps={tap_count}, hold={had_hold}")
         
         # Reset state
         self.tap_count = 0
         self.last_release_ms = 0
+        self._tap_deadline_ms = None
         self._pending_long_press = False
         
         if had_hold:
             # Had a hold - use _handle_long_press with accumulated tap count
             self._handle_long_press_with_taps(tap_count)
-        elif tap_count >= 5:
-            self._five_tap_first_station()
-        elif tap_count == 4:
-            self._prev_album()
-        elif tap_count == 3:
-            self._triple_tap()
-        elif tap_count == 2:
-            self._double_tap()
-        elif tap_count == 1:
-            self._single_tap()
-        else:
+            return
+        handler = self._input_dispatch.get((min(tap_count, 5), False))
+        if handler is None:
             self.hw.log(f"_resolve_input: no actionable input")
+            return
+        handler()
     
     def _single_tap(self):
         """Single tap - next track (next in shuffle order when in shuffle mode)."""
@@ -1039,7 +1366,7 @@ class RadioCore:
             # Ordered playlist/station/album, or radio: first track index
             self.current_track = 1
         self._save_state("triple tap restart")
-        self._start_playback_for_current()
+        self._start_playback_for_current(force=True)
     
     def _handle_long_press_with_taps(self, tap_count):
         """
@@ -1055,28 +1382,31 @@ class RadioCore:
         """
         self.hw.log(f"_handle_long_press_with_taps: tap_count={tap_count}")
         
-        if tap_count == 3:
-            self._five_tap_hold_shuffle_first_station()
-        elif tap_count == 2:
-            self._init_current_shuffle()
-            if not self.basic_mode:
-                self.hw.log(
-                    "2-tap+hold: shuffling current source (library shuffle removed)"
-                )
-        elif tap_count == 1:
-            if not self.basic_mode:
-                self._cycle_mode_basic()
-            elif self.mode == MODE_SHUFFLE:
-                # Exit shuffle and return to normal station mode
-                self.switch_mode(MODE_PLAYLIST)
-            # else: already in station mode, 1-tap + hold does nothing
-            # (0-tap + hold already advances the station)
-        elif tap_count == 0:
-            self._next_album()
-        else:
+        handler = self._input_dispatch.get((tap_count, True))
+        if handler is None:
             self.hw.log(
                 f"_handle_long_press_with_taps: {tap_count} taps + hold not mapped; ignoring"
             )
+            return
+        handler()
+
+    def _one_tap_hold(self):
+        """One tap + hold: non-basic cycles mode; basic exits shuffle to ordered station."""
+        if not self.basic_mode:
+            self._cycle_mode_basic()
+        elif self.mode == MODE_SHUFFLE:
+            # Exit shuffle and return to normal station mode
+            self.switch_mode(MODE_PLAYLIST)
+        # else: already in station mode, 1-tap + hold does nothing
+        # (0-tap + hold already advances the station)
+
+    def _two_tap_hold(self):
+        """Two taps + hold: shuffle / reshuffle the current source."""
+        self._init_current_shuffle()
+        if not self.basic_mode:
+            self.hw.log(
+                "2-tap+hold: shuffling current source (library shuffle removed)"
+            )
 
     def _five_tap_hold_shuffle_first_station(self) -> None:
         """Three taps + hold: jump to first source and reshuffle tracks.
@@ -1112,22 +1442,18 @@ class RadioCore:
         self.shuffle_index = 0
         self._init_current_shuffle()
     
+    # Next mode in the cycle; unlisted modes return to playlist (basic) / album.
+    _MODE_CYCLE_BASIC = {MODE_PLAYLIST: MODE_SHUFFLE}
+    _MODE_CYCLE = {MODE_ALBUM: MODE_PLAYLIST}
+
     def _cycle_mode_basic(self):
         """Cycle between modes. In basic_mode, album mode is not available --
         cycle between station (playlist) and shuffle only.
         """
         if self.basic_mode:
-            if self.mode == MODE_PLAYLIST:
-                self.switch_mode(MODE_SHUFFLE)
-            else:
-                self.switch_mode(MODE_PLAYLIST)
+            self.switch_mode(self._MODE_CYCLE_BASIC.get(self.mode, MODE_PLAYLIST))
         else:
-            if self.mode == MODE_ALBUM:
-                self.switch_mode(MODE_PLAYLIST)
-            elif self.mode == MODE_PLAYLIST:
-                self.switch_mode(MODE_ALBUM)
-            else:
-                self.switch_mode(MODE_ALBUM)
+            self.switch_mode(self._MODE_CYCLE.get(self.mode, MODE_ALBUM))
     
     def _init_current_shuffle(self, _retried=False):
         """Initialize shuffle mode for current album/playlist/station."""
@@ -1191,8 +1517,13 @@ class RadioCore:
             self.hw.log("Error: No tracks available to shuffle")
             return
         
+        resume_ids = self._resume_shuffle_ids
+        self._resume_shuffle_ids = None
+        resumed = bool(resume_ids) and self._restore_shuffle_order(tracks, resume_ids)
+        if resumed:
+            self.hw.log("Shuffle: resumed saved order")
         # Build shuffle list with minimal temporary allocations.
-        if not self._assign_and_shuffle_tracks(tracks, reason="init_current_shuffle"):
+        elif not self._assign_and_shuffle_tracks(tracks, reason="init_current_shuffle"):
             self.hw.log("Shuffle: low-memory while preparing shuffle; keeping current mode")
             return
         
@@ -1201,8 +1532,11 @@ class RadioCore:
             first_track = self.shuffle_tracks[0].get('title', 'Unknown') if self.shuffle_tracks[0] else 'Unknown'
             self.hw.log(f"Shuffled order starts with: {first_track}")
         
-        self.shuffle_index = 0
-        self.current_track = 1
+        if resumed:
+            self.current_track = min(max(1, self.current_track), len(self.shuffle_tracks))
+        else:
+            self.current_track = 1
+        self.shuffle_index = self.current_track - 1
         
         # Save shuffle source before switch; track list stays intact because switch_mode
         # only initializes shuffle when current list is empty.
@@ -1311,7 +1645,8 @@ class RadioCore:
         
         # Get track info for logging
         new_tr = self._get_current_track()
-        self.hw.log(f"_next_track: album {old_album+1} track {old_track} -> album {self.current_album_index+1} track {self.current_track}")
+        if self._log_on:
+            self.hw.log(f"_next_track: album {old_album+1} track {old_track} -> album {self.current_album_index+1} track {self.current_track}")
         self._folder_wrap_play = folder_wrap
         self._save_state("next track")
         self._start_playback_for_current()
@@ -1342,9 +1677,11 @@ class RadioCore:
             else:
                 self.current_track -= 1
         
-        self.hw.log(f"_prev_track: album {old_album+1} track {old_track} -> album {self.current_album_index+1} track {self.current_track}")
+        if self._log_on:
+            self.hw.log(f"_prev_track: album {old_album+1} track {old_track} -> album {self.current_album_index+1} track {self.current_track}")
         self._save_state("prev track")
-        self._start_playback_for_current()
+        # Previous on a one-track source restarts it, like any player
+        self._start_playback_for_current(force=True)
     
     def _next_album(self, from_auto_advance=False):
         """Move to next album/playlist (long press).
@@ -1763,14 +2100,12 @@ class RadioCore:
         if self.radio_mode_start_ms is None:
             self.radio_mode_start_ms = ticks_ms()
         elapsed_ms = ticks_diff(ticks_ms(), self.radio_mode_start_ms)
-        virtual_pos_ms = (station.start_offset_ms + elapsed_ms) % station.total_duration_ms
+        virtual_pos_ms = station.position_at(elapsed_ms)
 
         # Find which track should be playing at this virtual time
-        current_track, current_offset = self._find_track_at_position(station.tracks, virtual_pos_ms)
-        if not current_track:
-            return
-        
-        current_track_idx = station.tracks.index(current_track) + 1 if current_track in station.tracks else 1
+        i, current_offset = station.track_at(virtual_pos_ms)
+        current_track = station.tracks[i]
+        current_track_idx = i + 1
         
         # When a track finishes, we need to advance to the next track in the station
         # Check if virtual time has already moved to the next track
@@ -1778,39 +2113,30 @@ class RadioCore:
             # Virtual time says we should be on a different track - use that
             self.current_track = current_track_idx
             self._start_playback_for_track(current_track, start_ms=current_offset)
-            self.hw.log(f"Radio advanced to track {current_track_idx} at {current_offset // 1000}s (virtual time)")
+            if self._log_on:
+                self.hw.log(f"Radio advanced to track {current_track_idx} at {current_offset // 1000}s (virtual time)")
         else:
             # Still on the same track according to virtual time, but track finished
             # Force advance to next track in the station sequence
             next_track_idx = (self.current_track % len(station.tracks)) + 1
             
             next_track = station.tracks[next_track_idx - 1]
-            # Calculate offset for next track based on virtual time
-            # Find cumulative time up to this track
-            cumulative = 0
-            for i in range(next_track_idx - 1):
-                duration_ms = int((station.tracks[i].get('duration', 0) or 0) * 1000)
-                if duration_ms <= 0:
-                    duration_ms = 180000
-                cumulative += duration_ms
-            
-            # Calculate offset within next track
-            next_offset = virtual_pos_ms - cumulative
-            if next_offset < 0:
-                # Virtual time hasn't reached this track yet, start from beginning
-                next_offset = 0
+            # Calculate offset for next track based on virtual time: the track spans
+            # [previous track's end, its own end) on the station's cum_ms timeline
+            cum_ms = station.cum_ms
+            track_start = cum_ms[next_track_idx - 2] if next_track_idx > 1 else 0
+            if track_start <= virtual_pos_ms < cum_ms[next_track_idx - 1]:
+                next_offset = virtual_pos_ms - track_start
             else:
-                next_track_duration = int((next_track.get('duration', 0) or 0) * 1000)
-                if next_track_duration <= 0:
-                    next_track_duration = 180000
-                if next_offset >= next_track_duration:
-                    # Virtual time is past this track, wrap to beginning
-                    next_offset = 0
+                # Virtual time hasn't reached this track yet or is already past it:
+                # start from the beginning
+                next_offset = 0
             
             self.current_track = next_track_idx
-            self._radio_advance_cooldown_until_ms = ticks_ms() + 1500
+            self._radio_advance_cooldown_until_ms = ticks_add(ticks_ms(), 1500)
             self._start_playback_for_track(next_track, start_ms=next_offset)
-            self.hw.log(f"Radio advanced to track {next_track_idx} at {next_offset // 1000}s (track finished, forced advance)")
+            if self._log_on:
+                self.hw.log(f"Radio advanced to track {next_track_idx} at {next_offset // 1000}s (track finished, forced advance)")
     
     # ===========================
     #   MODE SWITCHING
@@ -1831,12 +2157,12 @@ class RadioCore:
 
     def _schedule_delayed_playback(self, reason):
         """Request exactly one AM transition before the next track start."""
-        if hasattr(self.hw, "set_delay_playback_reason"):
+        if self._hw_has_delay_reason:
             try:
                 self.hw.set_delay_playback_reason(reason)
             except Exception:
                 pass
-        if hasattr(self.hw, "set_delay_playback"):
+        if self._hw_has_delay:
             self.hw.set_delay_playback(True)
 
     def _maybe_schedule_station_change_am(self) -> None:
@@ -1868,6 +2194,7 @@ class RadioCore:
             self._clear_basic_library_virtual()
 
         self.mode = new_mode
+        self._current_tracks = None
         
         # Stop current playback before switching modes
         self.hw.stop()
@@ -1875,37 +2202,43 @@ class RadioCore:
         
         self._schedule_delayed_playback("mode_change")
         
-        if new_mode == MODE_SHUFFLE:
-            # Only initialize if shuffle list is empty (don't overwrite existing shuffle)
-            if self._shuffle_entry_count() == 0:
-                self._init_shuffle()
-        elif new_mode == MODE_RADIO:
-            if not self.radio_stations or self.radio_mode_start_ms is None:
-                self._init_radio()
-            # Radio mode playback is started in _init_radio() or handled by tune_radio()
-            self._save_state("mode switch")
-            return
-        else:
-            # For album/playlist mode, reset to track 1
-            self.current_track = 1
-            
-            # Reset album_index to 0 when switching between album and playlist modes
-            if (old_mode == MODE_ALBUM and new_mode == MODE_PLAYLIST) or \
-               (old_mode == MODE_PLAYLIST and new_mode == MODE_ALBUM):
-                self.current_album_index = 0
-            
-            # Ensure album_index is valid for the new mode
-            if new_mode == MODE_PLAYLIST:
-                if self.playlists and self.current_album_index >= len(self.playlists):
-                    self.current_album_index = 0
-            elif new_mode == MODE_ALBUM:
-                if self.albums and self.current_album_index >= len(self.albums):
-                    self.current_album_index = 0
-            
-            self.hw.log(f"[MODE] {old_mode} -> {new_mode}, album_idx={self.current_album_index}")
-        
+        enter = self._mode_enter.get(new_mode, self._enter_ordered_mode)
+        start_playback = enter(old_mode, new_mode)
         self._save_state("mode switch")
-        self._start_playback_for_current()
+        if start_playback:
+            self._start_playback_for_current()
+    
+    # Mode-entry steps for switch_mode(). Each returns True when switch_mode should
+    # start playback of the current track afterwards.
+    
+    def _enter_shuffle_mode(self, old_mode, new_mode):
+        # Only initialize if shuffle list is empty (don't overwrite existing shuffle)
+        if self._shuffle_entry_count() == 0:
+            self._init_shuffle()
+        return True
+    
+    def _enter_radio_mode(self, old_mode, new_mode):
+        if not self.radio_stations or self.radio_mode_start_ms is None:
+            self._init_radio()
+        # Radio mode playback is started in _init_radio() or handled by tune_radio()
+        return False
+    
+    def _enter_ordered_mode(self, old_mode, new_mode):
+        # For album/playlist mode, reset to track 1
+        self.current_track = 1
+        
+        # Reset album_index to 0 when switching between album and playlist modes
+        if (old_mode == MODE_ALBUM and new_mode == MODE_PLAYLIST) or \
+           (old_mode == MODE_PLAYLIST and new_mode == MODE_ALBUM):
+            self.current_album_index = 0
+        
+        # Ensure album_index is valid for the new mode
+        sources = self.playlists if new_mode == MODE_PLAYLIST else self.albums
+        if sources and self.current_album_index >= len(sources):
+            self.current_album_index = 0
+        
+        self.hw.log(f"[MODE] {old_mode} -> {new_mode}, album_idx={self.current_album_index}")
+        return True
     
     def _init_shuffle(self, start_playback=True):
         """Build shuffle tracks when entering shuffle with an empty list (mode cycle / boot)."""
@@ -1930,60 +2263,51 @@ class RadioCore:
         # Initialize radio mode for the first time
         self.radio_stations = []
         self.radio_mode_start_ms = ticks_ms()
+        self._radio_next_check_ms = ticks_add(self.radio_mode_start_ms, 1000)
         
+        # (station name, tracks), built in dial order:
+        # full library, albums, playlists. The synthetic 'Library' fallback is skipped.
+        sources = []
         # In basic mode, skip the full-library mega-station and albums
         if not self.basic_mode:
-            # Station 0: Full library
-            all_tracks = self.hw.get_all_tracks() or []
-            if all_tracks:
-                total_ms = sum((t.get('duration', 0) or 0) * 1000 for t in all_tracks)
-                total_ms = max(total_ms, 1)
-                random_offset = randint(0, max(int(total_ms) - 1, 0))
-                self.radio_stations.append(RadioStation(
-                    name="Full Library",
-                    tracks=all_tracks,
-                    total_duration_ms=int(total_ms),
-                    start_offset_ms=random_offset
-                ))
-                self.hw.log(f"Station 'Full Library': total={total_ms}ms, start_offset={random_offset}ms")
-        
+            library = self._station_cache.get("Full Library")
+            if library is None:
+                sources.append(("Full Library", self.hw.get_all_tracks() or []))
+            else:
+                sources.append(("Full Library", library.tracks))
         # Albums as stations (skipped in basic mode -- albums is empty)
         for album in self.albums:
             if album.get('id') == 0 and album.get('name') == 'Library':
                 continue
-            tracks = album.get('tracks', [])
-            if not tracks:
-                continue
-            total_ms = sum((t.get('duration', 0) or 0) * 1000 for t in tracks)
-            total_ms = max(total_ms, 1)
-            # Generate random start offset (0 to total_ms-1)
-            random_offset = randint(0, max(int(total_ms) - 1, 0))
-            self.radio_stations.append(RadioStation(
-                name=album.get('name', 'Unknown Album'),
-                tracks=tracks,
-                total_duration_ms=int(total_ms),
-                start_offset_ms=random_offset
-            ))
-            self.hw.log(f"Station '{album.get('name', 'Unknown')}': total={total_ms}ms, start_offset={random_offset}ms")
-        
+            sources.append((album.get('name', 'Unknown Album'), album.get('tracks', [])))
         # Playlists as stations
         for playlist in self.playlists:
             if playlist.get('id') == 0 and playlist.get('name') == 'Library':
                 continue
-            tracks = playlist.get('tracks', [])
-            if not tracks:
-                continue
-            total_ms = sum((t.get('duration', 0) or 0) * 1000 for t in tracks)
-            total_ms = max(total_ms, 1)
-            # Generate random start offset (0 to total_ms-1)
-            random_offset = randint(0, max(int(total_ms) - 1, 0))
-            self.radio_stations.append(RadioStation(
-                name=f"Playlist: {playlist.get('name', 'Unknown')}",
-                tracks=tracks,
-                total_duration_ms=int(total_ms),
-                start_offset_ms=random_offset
-            ))
-            self.hw.log(f"Station 'Playlist: {playlist.get('name', 'Unknown')}': total={total_ms}ms, start_offset={random_offset}ms")
+            sources.append((f"Playlist: {playlist.get('name', 'Unknown')}", playlist.get('tracks', [])))
+        
+        sources = [src for src in sources if src[1]]
+        # Offsets saved at the last power-off only line up with an unchanged station list.
+        saved_offsets = self._resume_radio_offsets
+        self._resume_radio_offsets = None
+        if not saved_offsets or len(saved_offsets) != len(sources):
+            saved_offsets = None
+        
+        cache = self._station_cache
+        for i, (name, tracks) in enumerate(sources):
+            station = cache.get(name)
+            if station is None or station.tracks is not tracks or len(station.cum_ms) != len(tracks):
+                station = RadioStation(name=name, tracks=tracks)
+                cache[name] = station
+            total_ms = station.total_duration_ms
+            if saved_offsets is not None and 0 <= saved_offsets[i] < total_ms:
+                random_offset = saved_offsets[i]
+            else:
+                # Generate random start offset (0 to total_ms-1)
+                random_offset = randrange(total_ms)
+            station.start_offset_ms = random_offset
+            self.radio_stations.append(station)
+            self.hw.log(f"Station '{name}': total={total_ms}ms, start_offset={random_offset}ms")
         
         self.radio_station_index = 0
         self.hw.log(f"Radio initialized with {len(self.radio_stations)} stations at time {self.radio_mode_start_ms}")
@@ -1997,13 +2321,12 @@ class RadioCore:
             # At initialization, elapsed time is 0, so virtual position = start_offset
             station = self.radio_stations[0]
             if station.tracks:
-                virtual_pos_ms = station.start_offset_ms % station.total_duration_ms
-                track, offset_ms = self._find_track_at_position(station.tracks, virtual_pos_ms)
-                if track:
-                    track_idx = station.tracks.index(track) + 1 if track in station.tracks else 1
-                    self.current_track = track_idx
-                    self._start_playback_for_track(track, start_ms=offset_ms)
-                    self.hw.log(f"Radio started: {station.name} - Track {track_idx} at {offset_ms // 1000}s (offset={offset_ms}ms from start_offset={station.start_offset_ms}ms)")
+                virtual_pos_ms = station.position_at(0)
+                i, offset_ms = station.track_at(virtual_pos_ms)
+                track_idx = i + 1
+                self.current_track = track_idx
+                self._start_playback_for_track(station.tracks[i], start_ms=offset_ms)
+                self.hw.log(f"Radio started: {station.name} - Track {track_idx} at {offset_ms // 1000}s (offset={offset_ms}ms from start_offset={station.start_offset_ms}ms)")
     
     def tune_radio(self, dial_value):
         """
@@ -2022,9 +2345,18 @@ class RadioCore:
             return
         
         # Map dial (0-100) to station index
-        max_idx = len(self.radio_stations) - 1
-        station_idx = int((dial_value / 100.0) * max_idx)
-        station_idx = max(0, min(station_idx, max_idx))
+        station_idx = dial_to_station_idx(dial_value, len(self.radio_stations) - 1)
+        
+        # ADC noise around the last reading is ignored, but only while it stays on the
+        # current station: callers may not resend, so a station change is never dropped.
+        now = ticks_ms()
+        last_dial = self._last_tune_dial
+        if station_idx == self.radio_station_index and last_dial is not None \
+                and -DIAL_JITTER < dial_value - last_dial < DIAL_JITTER \
+                and ticks_diff(now, self._last_tune_ms) < DIAL_SETTLE_MS:
+            return
+        self._last_tune_dial = dial_value
+        self._last_tune_ms = now
         
         # Check if station changed
         station_changed = (station_idx != self.radio_station_index)
@@ -2045,62 +2377,48 @@ class RadioCore:
             if self.radio_mode_start_ms is None:
                 return  # Still None after init, something is wrong
         
-        elapsed_ms = ticks_diff(ticks_ms(), self.radio_mode_start_ms)
-        virtual_pos_ms = (station.start_offset_ms + elapsed_ms) % station.total_duration_ms
+        elapsed_ms = ticks_diff(now, self.radio_mode_start_ms)
+        virtual_pos_ms = station.position_at(elapsed_ms)
         
-        # Log for debugging
-        self.hw.log(f"[RADIO DEBUG] tune_radio: dial={dial_value}, station_idx={station_idx}, station_changed={station_changed}")
-        self.hw.log(f"[RADIO DEBUG] Virtual time: radio_mode_start_ms={self.radio_mode_start_ms}, elapsed={elapsed_ms}ms")
-        self.hw.log(f"[RADIO DEBUG] Station '{station.name}': start_offset={station.start_offset_ms}ms, total_duration={station.total_duration_ms}ms")
-        self.hw.log(f"[RADIO DEBUG] Calculated virtual_pos={virtual_pos_ms}ms (formula: ({station.start_offset_ms} + {elapsed_ms}) % {station.total_duration_ms})")
+        if DEBUG_RADIO:
+            self.hw.log(f"[RADIO DEBUG] tune_radio: dial={dial_value}, station_idx={station_idx}, station_changed={station_changed}")
+            self.hw.log(f"[RADIO DEBUG] Virtual time: radio_mode_start_ms={self.radio_mode_start_ms}, elapsed={elapsed_ms}ms")
+            self.hw.log(f"[RADIO DEBUG] Station '{station.name}': start_offset={station.start_offset_ms}ms, total_duration={station.total_duration_ms}ms")
+            self.hw.log(f"[RADIO DEBUG] Calculated virtual_pos={virtual_pos_ms}ms (formula: ({station.start_offset_ms} + {elapsed_ms}) % {station.total_duration_ms})")
         
         # Find track at this position in the station's virtual timeline
-        track, offset_ms = self._find_track_at_position(station.tracks, virtual_pos_ms)
-        if track:
-            track_idx = station.tracks.index(track) + 1 if track in station.tracks else 1
-            
-            # Only restart when station or track (by virtual time) actually changed.
-            # Do NOT use get_playback_position_ms() to decide restart: during tuning we often
-            # just stopped playback (or AM overlay is playing), so position is 0 and we would
-            # restart on every dial tick and overwrite pending playback repeatedly.
-            should_restart = station_changed or (track_idx != self.current_track)
-            
+        i, offset_ms = station.track_at(virtual_pos_ms)
+        track = station.tracks[i]
+        track_idx = i + 1
+        
+        # Only restart when station or track (by virtual time) actually changed.
+        # Do NOT use get_playback_position_ms() to decide restart: during tuning we often
+        # just stopped playback (or AM overlay is playing), so position is 0 and we would
+        # restart on every dial tick and overwrite pending playback repeatedly.
+        should_restart = station_changed or (track_idx != self.current_track)
+        
+        if DEBUG_RADIO:
             current_pos_ms = self.hw.get_playback_position_ms()
             self.hw.log(f"[RADIO DEBUG] Found track: idx={track_idx}, offset={offset_ms}ms, should_restart={should_restart}")
             self.hw.log(f"[RADIO DEBUG] Current playback: pos={current_pos_ms}ms, track={self.current_track}, station_changed={station_changed}")
+        
+        self.current_track = track_idx
+        
+        if should_restart:
+            if self._log_on:
+                self.hw.log(f"Radio: {station.name} - Track {track_idx} at {offset_ms // 1000}s")
             
-            self.current_track = track_idx
+            # Cooldown so the next tick does not override this tune (correct track/offset)
+            self._radio_advance_cooldown_until_ms = ticks_add(now, 2500)
             
-            if should_restart:
-                self.hw.log(f"Radio: {station.name} - Track {track_idx} at {offset_ms // 1000}s")
-                
-                # Cooldown so the next tick does not override this tune (correct track/offset)
-                self._radio_advance_cooldown_until_ms = ticks_ms() + 2500
-                
-                # Play AM overlay when tuning to a new station
-                if station_changed:
-                    self.hw.play_am_overlay()
-                
-                # Start playback at the correct position in the station's timeline
-                self._start_playback_for_track(track, start_ms=offset_ms)
-            else:
-                self.hw.log(f"[RADIO DEBUG] Not restarting playback (same station and track)")
-    
-    def _find_track_at_position(self, tracks, position_ms):
-        """Find which track contains the given position."""
-        cumulative = 0
-        # Reduced logging to avoid recursion - only log key info when not in status retrieval
-        for i, track in enumerate(tracks):
-            duration_ms = int((track.get('duration', 0) or 0) * 1000)
-            if duration_ms <= 0:
-                duration_ms = 180000  # Default 3 minutes
-            track_end = cumulative + duration_ms
-            if track_end > position_ms:
-                offset = position_ms - cumulative
-                return track, offset
-            cumulative += duration_ms
-        # Position exceeds total - wrap to first track
-        return tracks[0] if tracks else None, 0
+            # Play AM overlay when tuning to a new station
+            if station_changed:
+                self.hw.play_am_overlay()
+            
+            # Start playback at the correct position in the station's timeline
+            self._start_playback_for_track(track, start_ms=offset_ms)
+        elif DEBUG_RADIO:
+            self.hw.log("[RADIO DEBUG] Not restarting playback (same station and track)")
     
     # ===========================
     #   POWER CONTROL
@@ -2114,12 +2432,12 @@ class RadioCore:
         self.hw.log("Power off")
         self.power_on = False
 
-        # Save resume state
+        # Save resume state. power_on_handler restarts from track 1, so the playback
+        # position is not queried from the player here.
         self.resume_state = {
             'mode': self.mode,
             'album_index': self.current_album_index,
             'track': self.current_track,
-            'position_ms': self.hw.get_playback_position_ms(),
         }
         
         self._save_state("power off")
@@ -2198,16 +2516,22 @@ class RadioCore:
     # ===========================
     
     def _get_current_tracks(self):
-        """Get the track list for current mode."""
+        """Get the track list for current mode.
+
+        Album and (non-basic) playlist lists are cached while the mode and album index
+        stay the same; see _current_tracks in __init__.
+        """
+        cached = self._current_tracks
+        if cached is not None and self._current_tracks_mode_id == self.mode_id:
+            return cached
         if self.mode == MODE_SHUFFLE:
             return self.shuffle_tracks
         elif self.mode == MODE_RADIO:
-            if self.radio_stations and self.radio_station_index < len(self.radio_stations):
-                return self.radio_stations[self.radio_station_index].tracks
-            return []
+            station = _safe_get(self.radio_stations, self.radio_station_index)
+            return station.tracks if station is not None else []
         elif self.mode == MODE_PLAYLIST:
-            if self.playlists and self.current_album_index < len(self.playlists):
-                playlist = self.playlists[self.current_album_index]
+            playlist = _safe_get(self.playlists, self.current_album_index)
+            if playlist is not None:
                 tracks = playlist.get('tracks', [])
                 if self.basic_mode and not tracks:
                     # Lazy-discovery path: hydrate current station on first access.
@@ -2220,20 +2544,32 @@ class RadioCore:
                     n = self._basic_playlist_track_count(playlist)
                     if n > 0:
                         return [self._build_basic_track(folder, i) for i in range(1, n + 1)]
+                elif not self.basic_mode:
+                    self._current_tracks = tracks
+                    self._current_tracks_mode_id = self.mode_id
                 # Don't log here - causes recursion when called from get_status() during logging
                 return tracks
             # Don't log here - causes recursion when called from get_status() during logging
             return []
         else:  # MODE_ALBUM
-            if self.albums and self.current_album_index < len(self.albums):
-                return self.albums[self.current_album_index].get('tracks', [])
+            album = _safe_get(self.albums, self.current_album_index)
+            if album is not None:
+                tracks = album.get('tracks', [])
+                if not self.basic_mode:
+                    self._current_tracks = tracks
+                    self._current_tracks_mode_id = self.mode_id
+                return tracks
             return []
     
     def _get_track_count(self):
         """Get total track count for current mode."""
+        cached = self._current_tracks
+        if cached is not None and self._current_tracks_mode_id == self.mode_id:
+            # Album / non-basic playlist list cached by _get_current_tracks()
+            return len(cached)
         if self.basic_mode and self.mode == MODE_PLAYLIST:
-            if self.playlists and self.current_album_index < len(self.playlists):
-                playlist = self.playlists[self.current_album_index]
+            playlist = _safe_get(self.playlists, self.current_album_index)
+            if playlist is not None:
                 if not playlist.get("tracks") and not playlist.get("hydrated"):
                     self._hydrate_basic_station(self.current_album_index, allow_assume=True)
                 return self._basic_playlist_track_count(playlist)
@@ -2249,8 +2585,8 @@ class RadioCore:
     def _get_current_track(self):
         """Get the current track dict."""
         if self.basic_mode and self.mode == MODE_PLAYLIST:
-            if self.playlists and self.current_album_index < len(self.playlists):
-                playlist = self.playlists[self.current_album_index]
+            playlist = _safe_get(self.playlists, self.current_album_index)
+            if playlist is not None:
                 tracks = playlist.get("tracks", [])
                 if tracks:
                     idx = max(self.current_track - 1, 0)
@@ -2283,8 +2619,13 @@ class RadioCore:
             return tracks[0] if tracks else None
         return tracks[idx]
     
-    def _start_playback_for_current(self, start_ms=0):
-        """Start playback for current track."""
+    def _start_playback_for_current(self, start_ms=0, force=False):
+        """Start playback for current track.
+
+        A request that resolves to the track already playing from the top, in the same
+        mode and album/playlist, is a no-op unless ``force`` is set (explicit restart
+        gestures). Switching source onto the same physical file still plays it.
+        """
         # Validate current state before getting track
         if self.mode == MODE_PLAYLIST:
             if not self.playlists:
@@ -2308,7 +2649,35 @@ class RadioCore:
                 self.hw.log(f"_start_playback_for_current: Invalid album index {self.current_album_index} (have {len(self.albums)} albums), resetting to 0")
                 self.current_album_index = 0
         
-        # Determine source name for logging (album/playlist/shuffle source)
+        track = self._get_current_track()
+        if track:
+            if not force and not start_ms and self.is_playing and \
+               self._playing_track_key == (self.mode, self.current_album_index) + _track_play_key(track) and \
+               self.hw.is_playing():
+                self.hw.log("_start_playback_for_current: track already playing, not restarting")
+                self._folder_wrap_play = False
+                # Nothing will start, so an AM transition armed by the caller must not
+                # gate the next real play_track().
+                if self._hw_has_delay:
+                    self.hw.set_delay_playback(False)
+                return
+            if self._log_on:
+                # Determine source name for logging (album/playlist/shuffle source)
+                source_name, shuffle_type = self._playback_source_label()
+                # In basic mode, report "station" instead of "playlist" so the GUI
+                # displays "Station" not "Playlist".
+                mode_label = "station" if (self.basic_mode and self.mode == MODE_PLAYLIST) else self.mode
+                # Combined log line — GUI parser extracts mode/source/shuffle_type/album_idx.
+                self.hw.log(
+                    f"_start_playback_for_current: mode={mode_label}, source={source_name}, "
+                    f"shuffle_type={shuffle_type}, album_idx={self.current_album_index}"
+                )
+            self._start_playback_for_track(track, start_ms=start_ms)
+        else:
+            self.hw.log(f"_start_playback_for_current: No track available (mode={self.mode}, album_idx={self.current_album_index}, track={self.current_track})")
+    
+    def _playback_source_label(self):
+        """(source_name, shuffle_type) for the playback log line the GUI parses."""
         source_name = ""
         shuffle_type = ""
         if self.mode == MODE_SHUFFLE:
@@ -2339,24 +2708,7 @@ class RadioCore:
         elif self.mode == MODE_ALBUM:
             if self.albums and self.current_album_index < len(self.albums):
                 source_name = self.albums[self.current_album_index].get('name', 'Unknown Album')
-        
-        track = self._get_current_track()
-        if track:
-            folder = track.get('folder')
-            track_num = track.get('track_number')
-            title = track.get('title', 'Unknown')
-            artist = track.get('artist', 'Unknown')
-            # In basic mode, report "station" instead of "playlist" so the GUI
-            # displays "Station" not "Playlist".
-            mode_label = "station" if (self.basic_mode and self.mode == MODE_PLAYLIST) else self.mode
-            # Combined log line — GUI parser extracts mode/source/shuffle_type/album_idx.
-            self.hw.log(
-                f"_start_playback_for_current: mode={mode_label}, source={source_name}, "
-                f"shuffle_type={shuffle_type}, album_idx={self.current_album_index}"
-            )
-            self._start_playback_for_track(track, start_ms=start_ms)
-        else:
-            self.hw.log(f"_start_playback_for_current: No track available (mode={self.mode}, album_idx={self.current_album_index}, track={self.current_track})")
+        return source_name, shuffle_type
     
     def _start_playback_for_track(self, track, start_ms=0):
         """Start playback for a specific track."""
@@ -2365,16 +2717,22 @@ class RadioCore:
             return
         
         # For DFPlayer, we need folder/track numbers
-        folder = track.get('folder', 1)
-        track_num = track.get('track_number', 1)
-        title = track.get('title', 'Unknown')
-        artist = track.get('artist', 'Unknown')
+        play_key = _track_play_key(track)
+        folder, track_num = play_key
         
-        self.hw.log(f"Starting playback: '{title}' by {artist} (folder={folder}, track={track_num}, start_ms={start_ms})")
+        if self._log_on:
+            self.hw.log(
+                f"Starting playback: '{track.get('title', 'Unknown')}' by {track.get('artist', 'Unknown')} "
+                f"(folder={folder}, track={track_num}, start_ms={start_ms})"
+            )
         
         # Set track hint for GUI emulator (ignored by DFPlayer firmware)
-        if hasattr(self.hw, 'set_current_track_hint'):
+        if self._hw_has_track_hint:
             self.hw.set_current_track_hint(track)
+        if self.mode_id == MODE_ID_RADIO:
+            # Station or track changed outside the virtual-time check; any pending
+            # boundary is stale, so re-check within the usual second.
+            self._radio_next_check_ms = ticks_add(ticks_ms(), 1000)
         
         folder_wrap = getattr(self, "_folder_wrap_play", False)
         self._folder_wrap_play = False
@@ -2389,12 +2747,10 @@ class RadioCore:
             # play_track returns True when DFPlayer gates the command (delay_playback /
             # AM overlay active). Do not mark logical playback until the real start runs.
             deferred = bool(getattr(self.hw, "_delay_playback", False))
-            get_oc = getattr(self.hw, "get_last_start_outcome", None)
-            if callable(get_oc):
+            if not deferred and self._hw_has_start_outcome:
                 try:
-                    oc = get_oc() or {}
-                    if oc.get("status") == "delayed":
-                        deferred = True
+                    oc = self.hw.get_last_start_outcome() or {}
+                    deferred = oc.get("status") == "delayed"
                 except Exception:
                     pass
             if deferred:
@@ -2404,24 +2760,21 @@ class RadioCore:
                 )
                 return
             self.is_playing = True
-            self.hw.log(f"Playback started successfully: '{title}' by {artist}")
+            self._playing_track_key = (self.mode, self.current_album_index) + play_key
+            if self._log_on:
+                self.hw.log(
+                    f"Playback started successfully: '{track.get('title', 'Unknown')}' by {track.get('artist', 'Unknown')}"
+                )
         else:
-            self.hw.log(f"Playback failed to start: '{title}' by {artist}")
+            self.hw.log(
+                f"Playback failed to start: '{track.get('title', 'Unknown')}' by {track.get('artist', 'Unknown')}"
+            )
             self.is_playing = False
             # Only trim station on UART "file not found" (0x06). BUSY timeout / no response
             # is not proof the file is missing (short MP3s, clone quirks, wiring).
             if self.basic_mode and getattr(self.hw, "_last_error_code", None) == 6:
                 self._handle_basic_track_not_found(folder, track_num)
-                return
-            deferred = bool(getattr(self.hw, "_delay_playback", False))
-            get_oc = getattr(self.hw, "get_last_start_outcome", None)
-            if callable(get_oc):
-                try:
-                    oc = get_oc() or {}
-                    if oc.get("status") == "delayed":
-                        deferred = True
-                except Exception:
-                    pass
+
     def _hw_play_track(self, folder, track_num, *, start_ms=0, folder_wrap=False, **kwargs):
         try:
             return self.hw.play_track(
@@ -2476,6 +2829,7 @@ class RadioCore:
                 prev_count = self._basic_playlist_track_count(pl)
                 if actual_count < prev_count:
                     pl["tracks"] = tracks[:actual_count]
+                    self._current_tracks = None
                     pl["track_count"] = actual_count
                     if hasattr(self.hw, "_known_tracks"):
                         self.hw._known_tracks[folder] = actual_count
@@ -2549,47 +2903,39 @@ class RadioCore:
     #   STATUS HELPERS
     # ===========================
     
-    def get_status(self):
-        """Get current status dict for display."""
-        source_name = "Unknown"
-        if self.mode == MODE_SHUFFLE:
-            # Determine shuffle source based on stored type
-            if self._shuffle_source_type == 'playlist':
-                if self.playlists and self.current_album_index < len(self.playlists):
-                    source_name = self.playlists[self.current_album_index].get('name', 'Playlist')
-                else:
-                    source_name = "Shuffle"
-            elif self._shuffle_source_type == 'album':
-                if self.albums and self.current_album_index < len(self.albums):
-                    source_name = self.albums[self.current_album_index].get('name', 'Album')
-                else:
-                    source_name = "Shuffle"
-            elif self._shuffle_source_type == 'station':
-                if self.playlists and self.current_album_index < len(self.playlists):
-                    source_name = self.playlists[self.current_album_index].get('name', 'Station')
-                else:
-                    source_name = "Shuffle"
-            else:
-                source_name = "Shuffle"
-        elif self.mode == MODE_RADIO:
-            if self.radio_stations and self.radio_station_index < len(self.radio_stations):
-                source_name = f"Radio: {self.radio_stations[self.radio_station_index].name}"
-            else:
-                source_name = "AM Radio"
-        elif self.mode == MODE_PLAYLIST:
-            if self.playlists and self.current_album_index < len(self.playlists):
-                source_name = self.playlists[self.current_album_index].get('name', 'Unknown')
+    def _source_name_album(self):
+        album = _safe_get(self.albums, self.current_album_index)
+        return album.get('name', 'Unknown') if album is not None else "Unknown"
+
+    def _source_name_playlist(self):
+        playlist = _safe_get(self.playlists, self.current_album_index)
+        return playlist.get('name', 'Unknown') if playlist is not None else "Unknown"
+
+    def _source_name_shuffle(self):
+        # Named after the collection the shuffle was drawn from
+        source = self._shuffle_source_type
+        if source == 'album':
+            coll, default = self.albums, 'Album'
+        elif source == 'playlist':
+            coll, default = self.playlists, 'Playlist'
+        elif source == 'station':
+            coll, default = self.playlists, 'Station'
         else:
-            if self.albums and self.current_album_index < len(self.albums):
-                source_name = self.albums[self.current_album_index].get('name', 'Unknown')
-        
+            return "Shuffle"
+        entry = _safe_get(coll, self.current_album_index)
+        return entry.get('name', default) if entry is not None else "Shuffle"
+
+    def _source_name_radio(self):
+        station = _safe_get(self.radio_stations, self.radio_station_index)
+        return f"Radio: {station.name}" if station is not None else "AM Radio"
+
+    def get_status(self):
+        """Get current status dict for display (a new dict on every call)."""
         track = self._get_current_track()
-        track_title = track.get('title', 'Unknown') if track else 'Unknown'
-        track_artist = track.get('artist', 'Unknown') if track else 'Unknown'
-        
+        track_title, track_artist = _track_display(track) if track else ('Unknown', 'Unknown')
         return {
             'mode': self.mode,
-            'source': source_name,
+            'source': self._source_name_resolvers.get(self.mode, self._source_name_album)(),
             'track_number': self.current_track,
             'track_count': self._get_track_count(),
             'track_title': track_title,
@@ -11,13 +11,13 @@ Architecture:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 import math
 import random
 import threading
 import time
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
 from PyQt6 import QtCore, QtGui, QtWidgets
 
@@ -32,7 +32,8 @@ from radio_core import (
     RadioCore, HardwareInterface,
     DF_BOOT_MS, LONG_PRESS_MS, TAP_WINDOW_MS,
     MODE_ALBUM, MODE_PLAYLIST, MODE_SHUFFLE, MODE_RADIO,
-    ticks_ms, ticks_diff,
+    ticks_ms, ticks_diff, dial_to_station_idx, track_duration_ms,
+    cumulative_ms, track_at_position,
 )
 
 # Keep these for backward compatibility in UI
@@ -63,6 +64,23 @@ class RadioStation:
     tracks: List[Dict]
     total_duration_ms: int
     start_offset_ms: int
+    # Running end offset (ms) of each track, same as radio_core.RadioStation.cum_ms
+    cum_ms: Sequence[int] = field(init=False, repr=False, default_factory=list)
+
+    def __post_init__(self) -> None:
+        self.cum_ms = cumulative_ms(track_duration_ms(t) for t in self.tracks)
+
+
+def _make_radio_station(name: str, tracks: List[Dict]) -> RadioStation:
+    """Station spanning its whole timeline, tuned in at a random offset.
+
+    Track lengths are resolved once here (unknown durations count as 3 minutes), so
+    the total matches the offsets track_at_position() bisects.
+    """
+    station = RadioStation(name=name, tracks=tracks, total_duration_ms=0, start_offset_ms=0)
+    station.total_duration_ms = station.cum_ms[-1] if station.cum_ms else 1
+    station.start_offset_ms = random.randrange(station.total_duration_ms)
+    return station
 
 
 class RadioFaceView(QtWidgets.QGraphicsView):
@@ -1433,37 +1451,21 @@ class TestModeWidget(QtWidgets.QWidget):
         all_tracks = [dict(track) for track in self.db.list_songs()]
         
         # Station 0: Full Library
-        lib_duration = sum((t.get("duration") or 0) * 1000 for t in all_tracks)
-        self.radio_stations.append(RadioStation(
-            name="Full Library",
-            tracks=all_tracks,
-            total_duration_ms=int(lib_duration) if lib_duration > 0 else 1,
-            start_offset_ms=random.randint(0, max(int(lib_duration) - 1, 0)) if lib_duration > 0 else 0,
-        ))
+        self.radio_stations.append(_make_radio_station("Full Library", all_tracks))
         
         # Albums as stations
         for album in self.albums:
             if album.album_id == 0 and album.name == "Library":
                 continue  # Skip the fallback library album
-            duration = sum((t.get("duration") or 0) * 1000 for t in album.tracks)
-            self.radio_stations.append(RadioStation(
-                name=album.name,
-                tracks=album.tracks,
-                total_duration_ms=int(duration) if duration > 0 else 1,
-                start_offset_ms=random.randint(0, max(int(duration) - 1, 0)) if duration > 0 else 0,
-            ))
+            self.radio_stations.append(_make_radio_station(album.name, album.tracks))
         
         # Playlists as stations
         for playlist in self.playlists:
             if playlist.playlist_id == 0 and playlist.name == "Library":
                 continue  # Skip the fallback library playlist
-            duration = sum((t.get("duration") or 0) * 1000 for t in playlist.tracks)
-            self.radio_stations.append(RadioStation(
-                name=f"Playlist: {playlist.name}",
-                tracks=playlist.tracks,
-                total_duration_ms=int(duration) if duration > 0 else 1,
-                start_offset_ms=random.randint(0, max(int(duration) - 1, 0)) if duration > 0 else 0,
-            ))
+            self.radio_stations.append(
+                _make_radio_station(f"Playlist: {playlist.name}", playlist.tracks)
+            )
         
         self.radio_mode_start_time = time.monotonic()
         self._log(f"Radio mode initialized with {len(self.radio_stations)} stations.")
@@ -1477,9 +1479,7 @@ class TestModeWidget(QtWidgets.QWidget):
             return
         
         # Map dial (0-100) to station index
-        max_index = len(self.radio_stations) - 1
-        station_index = int((dial_value / 100.0) * max_index)
-        station_index = max(0, min(station_index, max_index))
+        station_index = dial_to_station_idx(dial_value, len(self.radio_stations) - 1)
         self.radio_station_index = station_index
         
         station = self.radio_stations[station_index]
@@ -1492,12 +1492,10 @@ class TestModeWidget(QtWidgets.QWidget):
         virtual_position_ms = (station.start_offset_ms + elapsed_ms) % station.total_duration_ms
         
         # Find which track and position within that track
-        track, track_offset_ms = self._find_track_at_position(station.tracks, virtual_position_ms)
-        if track is None:
-            track = station.tracks[0]
-            track_offset_ms = 0
+        track_index, track_offset_ms = track_at_position(station.cum_ms, virtual_position_ms)
+        track = station.tracks[track_index]
         
-        self.current_track = station.tracks.index(track) + 1 if track in station.tracks else 1
+        self.current_track = track_index + 1
         self._log(f"Radio tuned to '{station.name}' - Track {self.current_track} at {track_offset_ms // 1000}s")
         # Play AM overlay when tuning to a station
         self._start_playback_for_song(track, offset_ms=track_offset_ms, with_am_overlay=True)
@@ -1620,18 +1618,21 @@ class TestModeWidget(QtWidgets.QWidget):
             # Normal volume when locked
             pygame.mixer.music.set_volume(base_volume)
 
-    def _find_track_at_position(self, tracks: List[Dict], position_ms: int) -> tuple:
-        """Find which track contains the given position and the offset within it."""
-        cumulative_ms = 0
-        for track in tracks:
-            duration_ms = int((track.get("duration") or 0) * 1000)
-            if duration_ms <= 0:
-                duration_ms = 180000  # Default 3 minutes if unknown
-            if cumulative_ms + duration_ms > position_ms:
-                return track, position_ms - cumulative_ms
-            cumulative_ms += duration_ms
-        # Position exceeds total - wrap to first track
-        return tracks[0] if tracks else None, 0
+    def _find_track_at_position(
+        self, tracks: List[Dict], position_ms: int, cum_ms: Optional[Sequence[int]] = None
+    ) -> tuple:
+        """Find which track contains the given position and the offset within it.
+
+        ``cum_ms`` is the station's precomputed end-offset list (RadioStation.cum_ms);
+        without it the offsets are derived from ``tracks``. Unknown durations count as
+        3 minutes.
+        """
+        if not tracks:
+            return None, 0
+        if cum_ms is None:
+            cum_ms = cumulative_ms(track_duration_ms(t) for t in tracks)
+        i, offset_ms = track_at_position(cum_ms, position_ms)
+        return tracks[i], offset_ms
     
     def _start_playback_for_song(self, song: Dict, *, offset_ms: Optional[int] = None, with_am_overlay: bool = False) -> None:
         path = self._resolve_song_path(song)
@@ -8,8 +8,10 @@ from radio_core import (
     MODE_PLAYLIST,
     MODE_RADIO,
     MODE_SHUFFLE,
+    MODE_IDS,
     RadioCore,
     RadioStation,
+    TAP_WINDOW_MS,
 )
 from tests.conftest import MockHardwareInterface, _make_test_albums, _make_test_playlists
 
@@ -23,16 +25,46 @@ class TestConstants:
     def test_all_modes(self):
         assert set(ALL_MODES) == {"album", "playlist", "shuffle", "radio"}
 
+    def test_mode_ids_unique(self):
+        assert set(MODE_IDS) == set(ALL_MODES)
+        assert len(set(MODE_IDS.values())) == len(ALL_MODES)
+
 
 class TestRadioStation:
     def test_total_duration(self):
         station = RadioStation("Test", [], total_duration_ms=5000)
         assert station.total_duration_ms == 5000
 
+    def test_total_duration_defaults_to_timeline_end(self):
+        station = RadioStation("Test", [{"duration": 60}, {"duration": None}])
+        assert station.total_duration_ms == station.cum_ms[-1] == 240_000
+        assert RadioStation("Test", []).total_duration_ms == 1
+
     def test_start_offset_default(self):
         station = RadioStation("Test", [])
         assert station.start_offset_ms == 0
 
+    def test_durations_column(self):
+        tracks = [{"duration": 60.5}, {"duration": 0}, {"duration": None}, {"duration": -3}]
+        station = RadioStation("Test", tracks)
+        assert list(station.durations_ms) == [60500, 180000, 180000, 180000]
+
+    def test_cumulative_offsets_and_track_at(self):
+        tracks = [{"duration": 10}, {"duration": 20}, {"duration": 30}]
+        station = RadioStation("Test", tracks)
+        assert list(station.cum_ms) == [10_000, 30_000, 60_000]
+        assert station.track_at(0) == (0, 0)
+        assert station.track_at(10_000) == (1, 0)
+        assert station.track_at(45_000) == (2, 15_000)
+        assert station.track_at(60_000) == (0, 0)
+
+    def test_position_at_wraps(self):
+        station = RadioStation("Test", [], total_duration_ms=10_000, start_offset_ms=4_000)
+        assert station.position_at(0) == 4_000
+        assert station.position_at(5_999) == 9_999
+        assert station.position_at(6_000) == 0
+        assert station.position_at(27_000) == 1_000
+
 
 class TestInit:
     def test_loads_albums_and_playlists(self, core, mock_hardware):
@@ -45,6 +77,51 @@ class TestInit:
         assert core.current_track == 1
         assert core.power_on is True
 
+    def test_track_durations_and_play_keys_stamped(self, core):
+        for album in core.albums:
+            for t in album["tracks"]:
+                assert t["_dur_ms"] == int(t["duration"] * 1000)
+                assert t["_play_key"] == (t["folder"], t["track_number"])
+                assert t["_display"] == (t["title"], t["artist"])
+
+    def test_reload_refreshes_stale_duration(self, core):
+        t = core.albums[0]["tracks"][0]
+        t["duration"] = 12.0
+        core._load_data()
+        assert t["_dur_ms"] == 12_000
+
+    def test_reload_refreshes_stale_play_key(self, core):
+        t = core.albums[0]["tracks"][0]
+        t["track_number"] = 7
+        core._load_data()
+        assert t["_play_key"] == (t["folder"], 7)
+
+    def test_reload_refreshes_stale_display(self, core):
+        t = core.albums[0]["tracks"][0]
+        t["title"] = "Renamed"
+        core._load_data()
+        assert t["_display"] == ("Renamed", t["artist"])
+
+    def test_current_folder_follows_album_index(self, core):
+        assert core.current_folder == 1
+        core.current_album_index = 2
+        assert core.current_folder == 3
+
+    def test_current_tracks_follow_album_and_library(self, core, mock_hardware):
+        assert core._get_current_tracks() is core.albums[0]["tracks"]
+        core.current_album_index = 1
+        assert core._get_current_tracks() is core.albums[1]["tracks"]
+        core.current_album_index = 0
+        core._get_current_tracks()
+        mock_hardware._albums = [{"id": 9, "name": "Solo", "tracks": [{"id": 1}]}]
+        core._load_data()
+        assert core._get_current_tracks() is mock_hardware._albums[0]["tracks"]
+
+    def test_current_tracks_follow_mode(self, core):
+        core._get_current_tracks()
+        core.mode = "playlist"
+        assert core._get_current_tracks() is core.playlists[0]["tracks"]
+
 
 class TestSingleTap:
     def test_advances_track(self, core, mock_hardware):
@@ -61,6 +138,42 @@ class TestSingleTap:
         assert core.current_track == 1
 
 
+class TestRestartGuard:
+    def _single_track_core(self, core, mock_hardware):
+        core.albums = [{"id": 1, "name": "Solo", "tracks": [
+            {"id": 1, "title": "Only", "duration": 60.0, "folder": 1, "track_number": 1},
+        ]}]
+        core.current_album_index = 0
+        core.current_track = 1
+        core._start_playback_for_current()
+        mock_hardware.calls.clear()
+
+    def test_next_on_playing_single_track_not_restarted(self, core, mock_hardware):
+        self._single_track_core(core, mock_hardware)
+        core._single_tap()
+        assert not any(c[0] == "play_track" for c in mock_hardware.calls)
+
+    def test_triple_tap_forces_restart(self, core, mock_hardware):
+        self._single_track_core(core, mock_hardware)
+        core._triple_tap()
+        assert any(c[0] == "play_track" for c in mock_hardware.calls)
+
+    def test_skipped_restart_clears_delay_flag(self, core, mock_hardware):
+        self._single_track_core(core, mock_hardware)
+        core._schedule_delayed_playback("station_change")
+        core._start_playback_for_current()
+        assert not any(c[0] == "play_track" for c in mock_hardware.calls)
+        assert mock_hardware._delay_playback is False
+
+    def test_same_file_from_another_source_plays(self, core, mock_hardware):
+        self._single_track_core(core, mock_hardware)
+        core.playlists = [{"id": 9, "name": "Mix", "tracks": list(core.albums[0]["tracks"])}]
+        core.mode = MODE_PLAYLIST
+        core.current_album_index = 0
+        core._start_playback_for_current()
+        assert any(c[0] == "play_track" for c in mock_hardware.calls)
+
+
 class TestDoubleTap:
     def test_goes_previous(self, core, mock_hardware):
         core.current_track = 2
@@ -250,6 +363,13 @@ class TestModeSwitching:
         core.switch_mode(MODE_PLAYLIST)
         assert core.mode == MODE_PLAYLIST
 
+    def test_mode_id_follows_mode(self, core, mock_hardware):
+        assert core.mode_id == MODE_IDS[MODE_ALBUM]
+        core.switch_mode(MODE_PLAYLIST)
+        assert core.mode_id == MODE_IDS[MODE_PLAYLIST]
+        core.mode = MODE_SHUFFLE
+        assert core.mode_id == MODE_IDS[MODE_SHUFFLE]
+
     def test_switch_to_same_mode_noop(self, core, mock_hardware):
         mock_hardware.calls.clear()
         core.switch_mode(MODE_ALBUM)
@@ -271,41 +391,41 @@ class TestModeSwitching:
         assert rc.mode in (MODE_PLAYLIST, old_mode)
 
 
-class TestFindTrackAtPosition:
-    def test_first_track(self, core):
+class TestStationTrackAt:
+    def test_first_track(self):
         tracks = [
             {"duration": 60.0},
             {"duration": 120.0},
         ]
-        track, offset = core._find_track_at_position(tracks, 30_000)
-        assert track == tracks[0]
+        i, offset = RadioStation("Test", tracks).track_at(30_000)
+        assert i == 0
         assert offset == 30_000
 
-    def test_second_track(self, core):
+    def test_second_track(self):
         tracks = [
             {"duration": 60.0},
             {"duration": 120.0},
         ]
-        track, offset = core._find_track_at_position(tracks, 70_000)
-        assert track == tracks[1]
+        i, offset = RadioStation("Test", tracks).track_at(70_000)
+        assert i == 1
         assert offset == 10_000
 
-    def test_position_zero(self, core):
+    def test_position_zero(self):
         tracks = [{"duration": 100.0}]
-        track, offset = core._find_track_at_position(tracks, 0)
-        assert track == tracks[0]
+        i, offset = RadioStation("Test", tracks).track_at(0)
+        assert i == 0
         assert offset == 0
 
-    def test_position_beyond_total(self, core):
+    def test_position_beyond_total(self):
         tracks = [{"duration": 10.0}]
-        track, offset = core._find_track_at_position(tracks, 20_000)
-        assert track == tracks[0]
+        i, offset = RadioStation("Test", tracks).track_at(20_000)
+        assert i == 0
         assert offset == 0
 
-    def test_zero_duration_defaults(self, core):
+    def test_zero_duration_defaults(self):
         tracks = [{"duration": 0}, {"duration": 60.0}]
-        track, offset = core._find_track_at_position(tracks, 100_000)
-        assert track == tracks[0]
+        i, offset = RadioStation("Test", tracks).track_at(100_000)
+        assert i == 0
         assert offset == 100_000
 
 
@@ -387,6 +507,13 @@ class TestShuffleNavigation:
         core._next_track()
         assert core.shuffle_index == (old_idx + 1) % len(core.shuffle_tracks)
 
+    def test_reentering_shuffle_keeps_order(self, core, mock_hardware):
+        core.switch_mode("shuffle")
+        order = list(core.shuffle_tracks)
+        core.switch_mode("playlist")
+        core.switch_mode("shuffle")
+        assert core.shuffle_tracks == order
+
     def test_prev_in_shuffle(self, core, mock_hardware):
         core._init_current_shuffle()
         core.shuffle_index = 0
@@ -407,6 +534,25 @@ class TestGestureEdgeCases:
         # No play_track should result from taps while powered off
         assert not any(c[0] == "play_track" for c in mock_hardware.calls)
 
+    def test_bounce_edges_ignored(self, core):
+        core.on_button_press(now=1000)
+        core.on_button_release(now=1100)
+        core.on_button_press(now=1110)
+        assert core.button_down is False
+        assert core.tap_count == 1
+
+    def test_quick_release_is_never_dropped(self, core):
+        core.on_button_press(now=1000)
+        core.on_button_release(now=1005)
+        assert core.button_down is False
+        core.on_button_press(now=1010)
+        assert core.button_down is False
+        assert core.tap_count == 1
+
+    def test_first_press_near_tick_zero_accepted(self, core):
+        core.on_button_press(now=5)
+        assert core.button_down is True
+
     def test_button_press_while_off_noop(self, core):
         core.power_off()
         # on_button_press is a no-op when power is off
@@ -447,6 +593,20 @@ class TestGestureEdgeCases:
         assert core.current_album_index == 0
         assert len(core.shuffle_tracks) > 0
 
+    def test_more_than_five_taps_jumps_to_first_source(self, core):
+        core.current_album_index = 2
+        core.tap_count = 7
+        core._resolve_input()
+        assert core.current_album_index == 0
+
+    def test_four_taps_hold_ignored(self, core, mock_hardware):
+        mock_hardware.calls.clear()
+        core._pending_long_press = True
+        core.tap_count = 4
+        core._resolve_input()
+        assert core.mode == MODE_ALBUM
+        assert not any(c[0] == "play_track" for c in mock_hardware.calls)
+
     def test_resolve_resets_tap_count(self, core):
         core.tap_count = 2
         core._pending_long_press = False
@@ -460,6 +620,15 @@ class TestGestureEdgeCases:
         core._resolve_input()
         assert core.last_release_ms == 0
 
+    def test_tap_resolves_at_deadline(self, core):
+        core.on_button_press(now=1000)
+        core.on_button_release(now=1100)
+        assert core.tick(now=1100 + TAP_WINDOW_MS - 1) is False
+        assert core.tap_count == 1
+        assert core.tick(now=1100 + TAP_WINDOW_MS) is True
+        assert core.tap_count == 0
+        assert core._tap_deadline_ms is None
+
 
 # ---------------------------------------------------------------------------
 # New tests: track navigation unhappy paths
@@ -514,6 +683,40 @@ class TestStatePersistence:
         assert saved["mode"] == "playlist"
         assert "known_tracks" in saved
 
+    def test_unchanged_state_not_rewritten(self, core, mock_hardware):
+        mock_hardware.calls.clear()
+        core._save_state("test", persist=True)
+        core._save_state("test", persist=True)
+        assert sum(c[0] == "save_state" for c in mock_hardware.calls) == 1
+        core.current_track += 1
+        core._save_state("test", persist=True)
+        assert sum(c[0] == "save_state" for c in mock_hardware.calls) == 2
+
+    def test_loaded_state_not_rewritten_at_power_off(self, core, mock_hardware):
+        core.current_track = 2
+        core._save_state("power off")
+        rc = RadioCore(mock_hardware)
+        rc.albums = core.albums
+        rc.playlists = core.playlists
+        rc._load_state()
+        mock_hardware.calls.clear()
+        rc._save_state("power off")
+        assert not any(c[0] == "save_state" for c in mock_hardware.calls)
+
+    def test_shuffle_order_and_radio_offsets_survive_reboot(self, core, mock_hardware):
+        core._init_radio()
+        offsets = [st.start_offset_ms for st in core.radio_stations]
+        core.switch_mode("shuffle")
+        order = [tr["id"] for tr in core.shuffle_tracks]
+        core._save_state("power off")
+        rc = RadioCore(mock_hardware)
+        rc.albums = core.albums
+        rc.playlists = core.playlists
+        rc._load_state()
+        assert [tr["id"] for tr in rc.shuffle_tracks] == order
+        rc._init_radio()
+        assert [st.start_offset_ms for st in rc.radio_stations] == offsets
+
     def test_next_track_does_not_persist_state(self, core, mock_hardware):
         mock_hardware.calls.clear()
         core._next_track()
@@ -674,6 +877,22 @@ class TestGetStatusAccuracy:
         assert status["mode"] == "shuffle"
         assert status["track_count"] == len(core.shuffle_tracks)
 
+    def test_status_source_per_mode(self, core):
+        assert core.get_status()["source"] == core.albums[0]["name"]
+        core._init_current_shuffle()
+        assert core.get_status()["source"] == core.albums[0]["name"]
+        core._shuffle_source_type = None
+        assert core.get_status()["source"] == "Shuffle"
+        core.switch_mode("radio")
+        assert core.get_status()["source"] == "Radio: " + core.radio_stations[0].name
+
+    def test_status_is_a_snapshot(self, core):
+        status = core.get_status()
+        volume = status["volume"]
+        core.set_volume(40)
+        assert core.get_status()["volume"] == 40
+        assert status["volume"] == volume
+
     def test_status_track_title_matches_current(self, core):
         status = core.get_status()
         expected_track = core.albums[0]["tracks"][0]
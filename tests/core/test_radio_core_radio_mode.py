@@ -7,6 +7,8 @@ time math and the behaviors that depend on it.
 
 from __future__ import annotations
 
+from unittest import mock
+
 import pytest
 
 from radio_core import (
@@ -15,6 +17,7 @@ from radio_core import (
     MODE_RADIO,
     RadioCore,
     RadioStation,
+    dial_to_station_idx,
 )
 from tests.conftest import MockHardwareInterface, _make_test_albums, _make_test_playlists
 
@@ -105,53 +108,70 @@ class TestRadioInit:
         radio_core._init_radio()
         assert radio_core.radio_mode_start_ms == first_start
 
+    def test_rebuild_reuses_station_timelines(self, radio_core):
+        radio_core._init_radio()
+        first = list(radio_core.radio_stations)
+        radio_core.radio_mode_start_ms = None
+        radio_core._init_radio()
+        assert all(a is b for a, b in zip(first, radio_core.radio_stations))
+
+    def test_rebuild_after_track_list_change(self, radio_core):
+        radio_core._init_radio()
+        album = radio_core.albums[0]
+        album["tracks"] = album["tracks"][:1]
+        radio_core.radio_mode_start_ms = None
+        radio_core._init_radio()
+        station = next(s for s in radio_core.radio_stations if s.name == album["name"])
+        assert station.tracks is album["tracks"]
+        assert len(station.cum_ms) == 1
+
 
 # ---------------------------------------------------------------------------
-# _find_track_at_position (virtual timeline math)
+# RadioStation.track_at (virtual timeline math)
 # ---------------------------------------------------------------------------
 
-class TestFindTrackAtPositionRadio:
-    def test_position_at_exact_boundary_between_tracks(self, radio_core):
+class TestStationTrackAtRadio:
+    def test_position_at_exact_boundary_between_tracks(self):
         """Exactly at track boundary should give track 2 with offset 0."""
         tracks = [
             {"duration": 60.0},
             {"duration": 60.0},
         ]
         # Position exactly at 60000ms = start of track 2
-        track, offset = radio_core._find_track_at_position(tracks, 60_000)
-        assert track == tracks[1]
+        i, offset = RadioStation("Test", tracks).track_at(60_000)
+        assert i == 1
         assert offset == 0
 
-    def test_position_beyond_total_wraps_to_first(self, radio_core):
+    def test_position_beyond_total_wraps_to_first(self):
         tracks = [{"duration": 30.0}]
-        track, offset = radio_core._find_track_at_position(tracks, 50_000)
+        i, offset = RadioStation("Test", tracks).track_at(50_000)
         # Beyond the only track - should wrap
-        assert track == tracks[0]
+        assert i == 0
 
-    def test_zero_duration_uses_default_180s(self, radio_core):
+    def test_zero_duration_uses_default_180s(self):
         """Track with duration=0 should use default 180000ms."""
         tracks = [
             {"duration": 0},
             {"duration": 60.0},
         ]
         # Position within the first "0-duration" track (default 180s)
-        track, offset = radio_core._find_track_at_position(tracks, 100_000)
-        assert track == tracks[0]
+        i, offset = RadioStation("Test", tracks).track_at(100_000)
+        assert i == 0
         assert offset == 100_000
 
-    def test_none_duration_uses_default(self, radio_core):
+    def test_none_duration_uses_default(self):
         tracks = [{"duration": None}, {"duration": 60.0}]
-        track, offset = radio_core._find_track_at_position(tracks, 50_000)
-        assert track == tracks[0]
+        i, offset = RadioStation("Test", tracks).track_at(50_000)
+        assert i == 0
 
-    def test_three_tracks_correct_selection(self, radio_core):
+    def test_three_tracks_correct_selection(self):
         tracks = [
             {"duration": 60.0},   # 0 - 60s
             {"duration": 90.0},   # 60s - 150s
             {"duration": 30.0},   # 150s - 180s
         ]
-        track, offset = radio_core._find_track_at_position(tracks, 100_000)
-        assert track == tracks[1]
+        i, offset = RadioStation("Test", tracks).track_at(100_000)
+        assert i == 1
         assert offset == 40_000  # 100000 - 60000
 
 
@@ -174,6 +194,20 @@ class TestTuneRadio:
         radio_core.tune_radio(100)
         assert radio_core.radio_station_index == len(radio_core.radio_stations) - 1
 
+    def test_dial_rounds_to_nearest_station(self):
+        assert dial_to_station_idx(24, 2) == 0
+        assert dial_to_station_idx(25, 2) == 1
+        assert dial_to_station_idx(75, 2) == 2
+        assert dial_to_station_idx(150, 2) == 2
+        assert dial_to_station_idx(-5, 2) == 0
+
+    def test_dial_to_station_idx_float_reading(self):
+        # With 101 stations each dial unit is one station: 2.6 is nearest station 3,
+        # which truncating the reading to 2 first would miss.
+        assert dial_to_station_idx(2.6, 100) == 3
+        assert dial_to_station_idx(2.4, 100) == 2
+        assert isinstance(dial_to_station_idx(2.6, 100), int)
+
     def test_station_change_triggers_am_overlay(self, radio_core, radio_hw):
         radio_core.switch_mode(MODE_RADIO)
         radio_hw.calls.clear()
@@ -188,12 +222,54 @@ class TestTuneRadio:
         radio_core.tune_radio(50)
         assert radio_core._radio_advance_cooldown_until_ms > ticks_ms()
 
+    def test_debug_trace_off_by_default(self, radio_core, radio_hw):
+        radio_core.switch_mode(MODE_RADIO)
+        radio_hw.logs.clear()
+        radio_core.tune_radio(100)
+        assert not any("[RADIO DEBUG]" in line for line in radio_hw.logs)
+
+    def test_tune_does_not_query_playback_position(self, radio_core, radio_hw):
+        radio_core.switch_mode(MODE_RADIO)
+        with mock.patch.object(radio_hw, "get_playback_position_ms", return_value=0) as pos:
+            radio_core.tune_radio(100)
+            radio_core.tune_radio(100)
+            radio_core.power_off()
+        pos.assert_not_called()
+
+    def test_dial_jitter_ignored_within_station(self, radio_core, radio_hw):
+        radio_core.switch_mode(MODE_RADIO)
+        max_idx = len(radio_core.radio_stations) - 1
+        # Two adjacent readings that land on the same station
+        dial = next(
+            d for d in range(100)
+            if dial_to_station_idx(d, max_idx) == dial_to_station_idx(d + 1, max_idx)
+        )
+        radio_core.tune_radio(dial)
+        radio_core.tune_radio(dial + 1)
+        assert radio_core._last_tune_dial == dial
+        assert radio_core.radio_station_index == dial_to_station_idx(dial, max_idx)
+
+    def test_small_move_across_station_boundary_not_dropped(self, radio_core, radio_hw):
+        radio_core.switch_mode(MODE_RADIO)
+        max_idx = len(radio_core.radio_stations) - 1
+        dial = next(
+            d for d in range(100)
+            if dial_to_station_idx(d, max_idx) != dial_to_station_idx(d + 1, max_idx)
+        )
+        radio_core.tune_radio(dial)
+        radio_core.tune_radio(dial + 1)
+        assert radio_core.radio_station_index == dial_to_station_idx(dial + 1, max_idx)
+
     def test_same_station_retune_does_not_trigger_am(self, radio_core, radio_hw):
         """Tuning to the same station that's already playing should not play AM overlay."""
         radio_core.switch_mode(MODE_RADIO)
         radio_core.tune_radio(0)
         radio_hw.calls.clear()
+        # Forget the last reading so the retune runs the full same-station path
+        # instead of the jitter gate.
+        radio_core._last_tune_dial = None
         radio_core.tune_radio(0)
+        assert radio_core._last_tune_dial == 0
         # No station change -> no AM overlay
         assert not any(c[0] == "play_am_overlay" for c in radio_hw.calls)
 
@@ -259,3 +335,16 @@ class TestRadioAdvanceCooldown:
             radio_core._check_radio_advance()
         except Exception as exc:
             pytest.fail(f"_check_radio_advance raised: {exc}")
+
+    def test_next_check_scheduled_at_track_boundary(self, radio_core):
+        radio_core.switch_mode(MODE_RADIO)
+        station = RadioStation("Two", [{"duration": 60.0}, {"duration": 90.0}],
+                               total_duration_ms=150_000, start_offset_ms=70_000)
+        radio_core.radio_stations = [station]
+        radio_core.radio_station_index = 0
+        radio_core.current_track = 2
+        radio_core._radio_advance_cooldown_until_ms = 0
+        radio_core.radio_mode_start_ms = 5_000
+        # Virtual position 75s: 15s into track 2, which ends at 150s
+        assert radio_core._check_radio_advance(now=10_000) is False
+        assert radio_core._radio_next_check_ms == 10_000 + 75_000
@@ -6,10 +6,15 @@ modules. We extract and test the pure parsing logic.
 """
 
 import json
+import sys
 from pathlib import Path
 
 import pytest
 
+# pi_hardware guards its VLC/GPIO imports, so it loads on any host.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "firmware" / "pi"))
+import pi_hardware  # noqa: E402
+
 
 class TestDFPlayerStateFormat:
     """Verify the album_state.txt format used by both builds."""
@@ -172,41 +177,59 @@ class TestMetadataParsing:
 
 
 class TestPiStateFormat:
-    """Pi hardware uses a simplified album_state.txt (no mode field in some builds)."""
-
-    @staticmethod
-    def _decode_pi_state(raw):
-        parts = raw.strip().split(";")
-        try:
-            a_str, t_str = parts[0].split(",")
-            album_idx = int(a_str) - 1
-            track = int(t_str)
-        except (ValueError, IndexError):
-            return {"mode": "album", "album_index": 0, "track": 1, "known_tracks": {}}
-        known_tracks = {}
-        if len(parts) > 1 and parts[1].startswith("tracks="):
-            for pair in parts[1][7:].split(","):
-                if not pair:
-                    continue
-                try:
-                    a, c = pair.split(":")
-                    known_tracks[int(a)] = int(c)
-                except ValueError:
-                    pass
-        return {"mode": "album", "album_index": album_idx, "track": track, "known_tracks": known_tracks}
+    """Pi hardware keeps album_state.txt in the shared format and resume data beside it."""
 
     def test_basic(self):
-        state = self._decode_pi_state("3,2;tracks=1:5,2:3")
+        state = pi_hardware._decode_state("3,2;tracks=1:5,2:3")
         assert state["album_index"] == 2
         assert state["track"] == 2
         assert state["known_tracks"] == {1: 5, 2: 3}
 
     def test_empty(self):
-        state = self._decode_pi_state("1,1;tracks=")
+        state = pi_hardware._decode_state("1,1;tracks=")
         assert state["album_index"] == 0
         assert state["track"] == 1
         assert state["known_tracks"] == {}
 
+    def test_malformed_position(self):
+        assert pi_hardware._decode_state("garbage") is None
+
+    def test_encode_keeps_shared_format(self):
+        state = {"mode": "shuffle", "album_index": 1, "track": 4, "known_tracks": {2: 3, 1: 5},
+                 "shuffle_order": [7, 3]}
+        assert pi_hardware._encode_state(state) == "2,4;tracks=1:5,2:3"
+
+    def test_resume_round_trip(self):
+        state = {"mode": "shuffle", "album_index": 1, "track": 4,
+                 "shuffle_source": "album", "shuffle_order": [7, 3], "radio_offsets": [1200]}
+        resume = pi_hardware._decode_resume(pi_hardware._encode_resume(state))
+        assert resume == {"mode": "shuffle", "shuffle_source": "album",
+                          "shuffle_order": [7, 3], "radio_offsets": [1200]}
+
+    def test_corrupt_resume_ignored(self):
+        assert pi_hardware._decode_resume("{bad") == {}
+        assert pi_hardware._decode_resume("[1, 2]") == {}
+
+    def test_save_then_load(self, tmp_path):
+        hw = pi_hardware.PiHardware(media_root=str(tmp_path))
+        hw.save_state({"mode": "radio", "album_index": 2, "track": 3,
+                       "known_tracks": {1: 4}, "radio_offsets": [5, 6]})
+        assert Path(pi_hardware.ALBUM_FILE).read_text() == "3,3;tracks=1:4"
+        state = hw.load_state()
+        assert state["mode"] == "radio"
+        assert state["album_index"] == 2
+        assert state["track"] == 3
+        assert state["radio_offsets"] == [5, 6]
+
+    def test_load_without_resume_file(self, tmp_path):
+        hw = pi_hardware.PiHardware(media_root=str(tmp_path))
+        Path(pi_hardware.ALBUM_FILE).parent.mkdir(parents=True)
+        Path(pi_hardware.ALBUM_FILE).write_text("2,5;tracks=")
+        state = hw.load_state()
+        assert state["mode"] == "album"
+        assert state["album_index"] == 1
+        assert state["track"] == 5
+
 
 class TestPiPathResolution:
     """Test _resolve_sd_path logic from pi_hardware (isolated from GPIO/VLC)."""
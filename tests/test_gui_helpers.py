@@ -17,7 +17,13 @@ from unittest import mock
 
 import pytest
 
-from gui.test_mode import TestModeWidget, AlbumState, PlaylistState, RadioStation
+from gui.test_mode import (
+    TestModeWidget,
+    AlbumState,
+    PlaylistState,
+    RadioStation,
+    _make_radio_station,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -93,6 +99,20 @@ class TestFindTrackAtPosition:
         assert track["title"] == "A"
         assert offset == 100_000
 
+    def test_uses_station_cumulative_offsets(self):
+        station = RadioStation(
+            name="S",
+            tracks=[{"title": "A", "duration": 60.0}, {"title": "B", "duration": None}],
+            total_duration_ms=240_000,
+            start_offset_ms=0,
+        )
+        assert list(station.cum_ms) == [60_000, 240_000]
+        track, offset = TestModeWidget._find_track_at_position(
+            None, station.tracks, 200_000, station.cum_ms
+        )
+        assert track["title"] == "B"
+        assert offset == 140_000
+
     def test_empty_tracks_returns_none(self):
         track, offset = self._call([], 5000)
         assert track is None
@@ -351,6 +371,12 @@ class TestRadioStationDataclass:
         assert s.tracks == []
         assert s.total_duration_ms == 0
 
+    def test_make_radio_station_spans_timeline(self):
+        s = _make_radio_station("S", [{"duration": 60.0}, {"duration": None}])
+        assert s.total_duration_ms == 240_000
+        assert 0 <= s.start_offset_ms < s.total_duration_ms
+        assert _make_radio_station("Empty", []).total_duration_ms == 1
+
 
 # ---------------------------------------------------------------------------
 # AlbumState / PlaylistState dataclasses